@@ -12,13 +12,36 @@ Aligned with:
 © 2026 Paul Desai / N1 Intelligence
 """
 
-from glyph_engine.token import GlyphToken, GlyphClass
-from glyph_engine.input import InputMessage, InputType, CommandVerb
-from glyph_engine.scroll import Scroll, ScrollTransition
-from glyph_engine.validator import Validator, ValidatorResult
-from glyph_engine.engine import GlyphEngine, create_engine
-from glyph_engine.audit import AuditLog, AuditEvent
-from glyph_engine.store import GlyphStore
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from glyph_engine.token import GlyphToken, GlyphClass
+    from glyph_engine.input import InputMessage, InputType, CommandVerb
+    from glyph_engine.scroll import Scroll, ScrollTransition
+    from glyph_engine.validator import Validator, ValidatorResult
+    from glyph_engine.engine import GlyphEngine, create_engine
+    from glyph_engine.audit import AuditLog, AuditEvent
+    from glyph_engine.store import GlyphStore
+
+# Public names are imported on first access (PEP 562) so that light
+# entry points such as `glyph hash` don't pay for pydantic at startup.
+_EXPORTS = {
+    "GlyphToken": "glyph_engine.token",
+    "GlyphClass": "glyph_engine.token",
+    "InputMessage": "glyph_engine.input",
+    "InputType": "glyph_engine.input",
+    "CommandVerb": "glyph_engine.input",
+    "Scroll": "glyph_engine.scroll",
+    "ScrollTransition": "glyph_engine.scroll",
+    "Validator": "glyph_engine.validator",
+    "ValidatorResult": "glyph_engine.validator",
+    "GlyphEngine": "glyph_engine.engine",
+    "create_engine": "glyph_engine.engine",
+    "AuditLog": "glyph_engine.audit",
+    "AuditEvent": "glyph_engine.audit",
+    "GlyphStore": "glyph_engine.store",
+}
 
 __version__ = "1.0.0"
 __author__ = "Paul Desai"
@@ -39,3 +62,16 @@ __all__ = [
     "AuditEvent",
     "GlyphStore",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
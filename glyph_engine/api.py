@@ -10,19 +10,38 @@ Endpoints:
 - GET /health            — Health check
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
+from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import yaml
+from typing import Any, Dict, Optional
 
-from glyph_engine.proof import BeaconProof, verify_beacon, generate_verification_badge
+from glyph_engine.proof import BeaconProof, InclusionProof, generate_verification_badge
+from glyph_engine.registry import DEFAULT_REGISTRY_PATH, load_registry
+
+try:
+    import orjson
+except ImportError:  # orjson ships with the [api] extra
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (stdlib json if unavailable)."""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
 
 
 app = FastAPI(
     title="⟡ Beacon Verify API",
     description="Cryptographic verification for AI artifact provenance",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
 )
 
 # Enable CORS for web demo
@@ -33,15 +52,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize proof system
-REGISTRY_PATH = Path(__file__).parent.parent / "beacon_registry" / "BEACON_REGISTRY.yaml"
-prover = BeaconProof(REGISTRY_PATH)
-
+# Proof system; the prover is built per registry version (see _prover)
+REGISTRY_PATH = DEFAULT_REGISTRY_PATH
 
-@app.get("/")
-async def root():
-    """Redirect to verification page."""
-    return HTMLResponse(content="""
+# Static pages are rendered once at import, not per request
+_ROOT_HTML = """
     <html>
         <head>
             <meta http-equiv="refresh" content="0; url=/docs">
@@ -55,27 +70,116 @@ async def root():
             </div>
         </body>
     </html>
-    """)
+    """
+
+_DEMO_PATH = Path(__file__).parent.parent / "web" / "index.html"
+try:
+    _DEMO_HTML = _DEMO_PATH.read_text()
+except OSError:
+    _DEMO_HTML = "<h1>Demo page not found</h1>"
+
+
+# ==================== RESULT CACHES ====================
+# The registry is append-only, so proofs for a beacon are stable for a
+# given registry file. Keying on mtime invalidates them on any change.
+# Only the stable parts are cached; every response is a fresh dict
+# stamped with the request time. ZKP commitments are not cached: each
+# one needs a fresh blinding factor.
+
+def _registry_mtime() -> int:
+    """Registry mtime, used as a cache key."""
+    try:
+        return REGISTRY_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _prover_for(registry_mtime: int) -> BeaconProof:
+    """Prover over the registry as of registry_mtime."""
+    return BeaconProof(REGISTRY_PATH)
+
+
+def _prover() -> BeaconProof:
+    """Prover for the current registry, rebuilt when the file changes."""
+    return _prover_for(_registry_mtime())
+
+
+@lru_cache(maxsize=4096)
+def _cached_proof(beacon_id: str, registry_mtime: int) -> Optional[InclusionProof]:
+    return _prover_for(registry_mtime).generate_inclusion_proof(beacon_id)
+
+
+@lru_cache(maxsize=1)
+def _cached_integrity(registry_mtime: int) -> Dict[str, Any]:
+    """Registry integrity report without its timestamp (file hashed once)."""
+    report = _prover_for(registry_mtime).verify_registry_integrity()
+    report.pop("timestamp", None)
+    return report
+
+
+def _stamped_proof(proof: InclusionProof, timestamp: str) -> Dict[str, Any]:
+    """Response dict for a cached proof, stamped with the request time."""
+    return replace(proof, proof_path=list(proof.proof_path), timestamp=timestamp).to_dict()
+
+
+def _verify(beacon_id: str) -> Dict[str, Any]:
+    """verify_beacon's result for the current registry, from the caches."""
+    registry_mtime = _registry_mtime()
+    proof = _cached_proof(beacon_id, registry_mtime)
+    if proof is None:
+        return {
+            "verified": False,
+            "beacon_id": beacon_id,
+            "error": "Beacon not found in registry",
+        }
+    
+    now = datetime.utcnow().isoformat()
+    return {
+        "verified": True,
+        "beacon_id": beacon_id,
+        "beacon_hash": proof.beacon_hash,
+        "merkle_root": proof.root_hash,
+        "proof": _stamped_proof(proof, now),
+        "registry_integrity": {**_cached_integrity(registry_mtime), "timestamp": now},
+    }
+
+
+def normalized_beacon_id(beacon_id: str) -> str:
+    """Canonical (upper-case) form of the beacon_id path parameter."""
+    return beacon_id.upper()
+
+
+@app.get("/")
+async def root():
+    """Redirect to verification page."""
+    return HTMLResponse(content=_ROOT_HTML)
 
 
 @app.get("/health")
 async def health():
     """Health check."""
+    prover = _prover()
+    root = prover.get_root_hash()
     return {
         "status": "healthy",
-        "merkle_root": prover.get_root_hash()[:16] if prover.get_root_hash() else None,
-        "beacon_count": len(prover._beacons),
+        "merkle_root": root[:16] if root else None,
+        "beacon_count": prover.beacon_count,
+        "cache": {
+            "proof": _cached_proof.cache_info()._asdict(),
+            "integrity": _cached_integrity.cache_info()._asdict(),
+        },
     }
 
 
 @app.get("/verify/{beacon_id}")
-async def verify_endpoint(beacon_id: str):
+async def verify_endpoint(beacon_id: str = Depends(normalized_beacon_id)):
     """
     Verify a beacon exists in the registry.
     
     Returns verification result with cryptographic proof.
     """
-    result = verify_beacon(beacon_id.upper(), REGISTRY_PATH)
+    result = _verify(beacon_id)
     
     if not result["verified"]:
         raise HTTPException(status_code=404, detail=result.get("error", "Beacon not found"))
@@ -84,28 +188,28 @@ async def verify_endpoint(beacon_id: str):
 
 
 @app.get("/proof/{beacon_id}")
-async def proof_endpoint(beacon_id: str):
+async def proof_endpoint(beacon_id: str = Depends(normalized_beacon_id)):
     """
     Get Merkle inclusion proof for a beacon.
     
     This proof can be verified offline.
     """
-    proof = prover.generate_inclusion_proof(beacon_id.upper())
+    proof = _cached_proof(beacon_id, _registry_mtime())
     
     if proof is None:
         raise HTTPException(status_code=404, detail=f"Beacon {beacon_id} not found")
     
-    return proof.to_dict()
+    return _stamped_proof(proof, datetime.utcnow().isoformat())
 
 
 @app.get("/zkp/{beacon_id}")
-async def zkp_endpoint(beacon_id: str):
+async def zkp_endpoint(beacon_id: str = Depends(normalized_beacon_id)):
     """
     Generate zero-knowledge commitment.
     
     Proves beacon membership without revealing which beacon.
     """
-    commitment = prover.generate_zkp_commitment(beacon_id.upper())
+    commitment = _prover().generate_zkp_commitment(beacon_id)
     
     if commitment is None:
         raise HTTPException(status_code=404, detail=f"Beacon {beacon_id} not found")
@@ -121,27 +225,28 @@ async def registry_endpoint():
     if not REGISTRY_PATH.exists():
         raise HTTPException(status_code=500, detail="Registry not found")
     
-    with open(REGISTRY_PATH) as f:
-        data = yaml.safe_load(f)
+    view = load_registry(REGISTRY_PATH)
+    prover = _prover()
     
-    return {
-        "beacons": data.get("beacons", []),
+    # Registry data is already JSON-safe; skip jsonable_encoder's walk
+    return FastJSONResponse(content={
+        "beacons": view.beacons,
         "merkle_root": prover.get_root_hash(),
         "integrity": prover.verify_registry_integrity(),
-    }
+    })
 
 
 @app.get("/badge/{beacon_id}")
-async def badge_endpoint(beacon_id: str):
+async def badge_endpoint(beacon_id: str = Depends(normalized_beacon_id)):
     """
     Get embeddable badge markdown.
     """
-    result = verify_beacon(beacon_id.upper(), REGISTRY_PATH)
+    verified = _cached_proof(beacon_id, _registry_mtime()) is not None
     
     return {
-        "beacon_id": beacon_id.upper(),
-        "verified": result["verified"],
-        "markdown": generate_verification_badge(beacon_id.upper()),
+        "beacon_id": beacon_id,
+        "verified": verified,
+        "markdown": generate_verification_badge(beacon_id, verified=verified),
     }
 
 
@@ -149,12 +254,7 @@ async def badge_endpoint(beacon_id: str):
 @app.get("/demo", response_class=HTMLResponse)
 async def demo_page():
     """Serve the verification demo page."""
-    html_path = Path(__file__).parent.parent / "web" / "index.html"
-    if html_path.exists():
-        with open(html_path) as f:
-            return f.read()
-    else:
-        return "<h1>Demo page not found</h1>"
+    return HTMLResponse(content=_DEMO_HTML)
 
 
 if __name__ == "__main__":
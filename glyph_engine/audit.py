@@ -8,12 +8,26 @@ Gap #3 mitigation: Includes "archaeology" helpers for reconstructing
 why current state is what it is.
 """
 
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict, deque
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
 from pathlib import Path
-from pydantic import BaseModel, Field
-import json
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+import mmap
+import os
+import queue
+import threading
+import time
+import warnings
+import weakref
+
+# Write batching knobs (events per write / max age of a pending batch)
+AUDIT_BATCH_SIZE = int(os.environ.get("GLYPH_AUDIT_BATCH_SIZE", "64"))
+AUDIT_BATCH_MS = float(os.environ.get("GLYPH_AUDIT_BATCH_MS", "50"))
+# Pending events before append() blocks (back-pressure, nothing is dropped)
+AUDIT_QUEUE_SIZE = int(os.environ.get("GLYPH_AUDIT_QUEUE_SIZE", "10000"))
 
 
 class AuditEventType(str, Enum):
@@ -35,6 +49,8 @@ class AuditEvent(BaseModel):
     
     Every field is explicit. No inference.
     """
+    model_config = ConfigDict(frozen=True)
+    
     event_id: str = Field(..., description="Unique event ID")
     event_type: AuditEventType
     glyph_id: str
@@ -53,9 +69,168 @@ class AuditEvent(BaseModel):
     validator_id: Optional[str] = None
     validation_results: Optional[List[Dict[str, Any]]] = None
     
-    def to_jsonl(self) -> str:
-        """Serialize to JSONL format."""
-        return self.model_dump_json() + "\n"
+    def to_jsonl(self) -> bytes:
+        """Serialize to JSONL format (UTF-8 bytes, ready for the log)."""
+        return _EVENT_ADAPTER.dump_json(self) + b"\n"
+
+
+# Shared (de)serializer: bytes in and out, no str round-trip
+_EVENT_ADAPTER = TypeAdapter(AuditEvent)
+
+
+class AuditWriteError(OSError):
+    """The background writer failed; the events it held were not written."""
+    
+    def __init__(self, lost: int, cause: BaseException):
+        super().__init__(f"audit log write failed, {lost} event(s) not written: {cause}")
+        self.lost = lost
+
+
+class _AuditSink:
+    """
+    Background writer behind AuditLog.
+    
+    write() is a queue.put; a daemon thread drains the queue and appends
+    each batch (up to batch_size items, or whatever arrived within the
+    batch window) with a single write. The queue is bounded, so a slow
+    disk blocks producers instead of dropping events.
+    
+    Events only count as recorded once written: each item carries its
+    events, and the writer hands them to `written` after a successful
+    write. A failed write keeps the first error (and how many events
+    were lost), which is raised from the next write(), flush() or close().
+    """
+    
+    _FLUSH = object()
+    _STOP = object()
+    
+    def __init__(
+        self,
+        log_path: Path,
+        batch_size: int,
+        batch_ms: float,
+        max_pending: int = AUDIT_QUEUE_SIZE,
+    ):
+        self.log_path = log_path
+        self.batch_size = max(1, batch_size)
+        self.batch_interval = batch_ms / 1000.0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._lost = 0
+        # Items queued by write() / finished by the writer (see pending())
+        self._submitted = 0
+        self._completed = 0
+        # Events written to disk, in order, not yet taken by AuditLog
+        self.written: "deque[AuditEvent]" = deque()
+    
+    def _ensure_thread(self) -> None:
+        """Start the writer thread on first use (or after close())."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="glyph-audit-writer", daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self) -> None:
+        """Writer loop: block for one item, then gather a batch."""
+        q = self._queue
+        fh = None
+        stop = False
+        while not stop:
+            batch = [q.get()]
+            taken = 1
+            deadline = time.monotonic() + self.batch_interval
+            while batch[-1] is not self._FLUSH and batch[-1] is not self._STOP:
+                if taken >= self.batch_size:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(q.get(timeout=timeout))
+                except queue.Empty:
+                    break
+                taken += 1
+            
+            stop = batch[-1] is self._STOP
+            items = [item for item in batch if item.__class__ is tuple]
+            try:
+                if items:
+                    if fh is None:
+                        fh = open(self.log_path, "ab", buffering=1 << 16)
+                    fh.write(b"".join([data for data, _ in items]))
+                    fh.flush()
+                    for _, events in items:
+                        self.written.extend(events)
+            except OSError as exc:
+                # Keep the first error; later ones are usually its echo
+                if self._error is None:
+                    self._error = exc
+                self._lost += sum(len(events) for _, events in items)
+                if fh is not None:
+                    try:
+                        fh.close()
+                    except OSError:
+                        pass
+                    fh = None  # reopen on the next batch
+            finally:
+                self._completed += len(items)
+                for _ in range(taken):
+                    q.task_done()
+        
+        if fh is not None:
+            fh.close()
+    
+    def _raise_pending_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            lost, self._lost = self._lost, 0
+            raise AuditWriteError(lost, error) from error
+    
+    def pending(self) -> bool:
+        """Whether anything queued is unwritten, or an error is unreported."""
+        return self._submitted != self._completed or self._error is not None
+    
+    def write(self, data: bytes, events: List["AuditEvent"]) -> None:
+        """
+        Enqueue serialized events, written contiguously.
+        
+        Blocks only while the queue is full. Raises the error of an
+        earlier failed write first, so a failure is never silent.
+        """
+        if self._error is not None:
+            self._raise_pending_error()
+        if self._thread is None:
+            self._ensure_thread()
+        self._submitted += 1
+        self._queue.put((data, events))
+    
+    def flush(self) -> None:
+        """Block until every queued item has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            # The marker cuts short any batch the writer is still gathering
+            self._queue.put(self._FLUSH)
+            self._queue.join()
+        self._raise_pending_error()
+    
+    def close(self) -> None:
+        """Write pending items, stop the writer and release the file."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join()
+        self._thread = None  # a later write() starts a fresh writer
+        self._raise_pending_error()
+    
+    def close_at_exit(self) -> None:
+        """close() for finalizers, where nobody can catch the error."""
+        try:
+            self.close()
+        except AuditWriteError as exc:
+            warnings.warn(f"{exc} ({self.log_path})", RuntimeWarning)
 
 
 class AuditLog:
@@ -64,18 +239,87 @@ class AuditLog:
     
     Stores events in JSONL format for easy replay and analysis.
     Gap #6 consideration: No "ephemeral" mode - everything is logged.
+    
+    Because the log is append-only, per-glyph and per-type indexes are
+    built with one pass over the file on first query and then kept
+    current by append(). This assumes the AuditLog instance is the only
+    writer to its file while it is alive.
+    
+    Writes go through a background writer thread and are batched
+    (GLYPH_AUDIT_BATCH_SIZE / GLYPH_AUDIT_BATCH_MS), so append() costs a
+    queue.put. Pending events are flushed before any read, on close(),
+    and when the log is garbage-collected or the interpreter exits.
+    Events enter the indexes only once written; a failed write raises
+    AuditWriteError from the next append(), read or close().
     """
     
-    def __init__(self, log_path: Path):
+    def __init__(
+        self,
+        log_path: Path,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        batch_ms: float = AUDIT_BATCH_MS,
+    ):
         """Initialize with path to JSONL file."""
         self.log_path = log_path
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
         self._event_counter = 0
+        
+        self._sink = _AuditSink(log_path, batch_size, batch_ms)
+        self._finalizer = weakref.finalize(self, self._sink.close_at_exit)
+        
+        # In-memory indexes (populated lazily, see _ensure_index)
+        self._indexed = False
+        self._by_glyph: Dict[str, List[AuditEvent]] = defaultdict(list)
+        self._by_type: Counter = Counter()
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        
+        # Events sorted by timestamp, with a parallel key list for bisect
+        self._timestamps: List[datetime] = []
+        self._events_in_order: List[AuditEvent] = []
+    
+    def _index_event(self, event: AuditEvent) -> None:
+        """Add a single event to the in-memory indexes."""
+        self._by_glyph[event.glyph_id].append(event)
+        self._by_type[event.event_type] += 1
+        self._summary_cache = None
+        
+        # Appends are normally in timestamp order; insert in place if the
+        # clock stepped backwards so the bisect invariant still holds
+        ts = event.timestamp
+        if not self._timestamps or ts >= self._timestamps[-1]:
+            self._timestamps.append(ts)
+            self._events_in_order.append(event)
+        else:
+            pos = bisect_right(self._timestamps, ts)
+            self._timestamps.insert(pos, ts)
+            self._events_in_order.insert(pos, event)
+    
+    def _ensure_index(self) -> None:
+        """Build indexes from disk once, then add events as they are written."""
+        sink = self._sink
+        if not self._indexed:
+            sink.flush()
+            sink.written.clear()  # already on disk, so read below
+            for event in self._iter_events():
+                self._index_event(event)
+            self._indexed = True
+            return
+        if sink.pending():
+            sink.flush()
+        written = sink.written
+        while written:
+            self._index_event(written.popleft())
+    
+    def _submit(self, events: List[AuditEvent]) -> None:
+        """Queue events for writing as one contiguous unit."""
+        if not self._finalizer.alive:
+            # Closed earlier: make sure the restarted writer is flushed too
+            self._finalizer = weakref.finalize(self, self._sink.close_at_exit)
+        self._sink.write(b"".join([event.to_jsonl() for event in events]), events)
     
     def append(self, event: AuditEvent) -> None:
         """Append event to log (never overwrite)."""
-        with open(self.log_path, "a") as f:
-            f.write(event.to_jsonl())
+        self._submit([event])
     
     def create_event(
         self,
@@ -106,35 +350,75 @@ class AuditLog:
         self.append(event)
         return event
     
-    def read_all(self) -> List[AuditEvent]:
-        """Read all events from log."""
-        if not self.log_path.exists():
-            return []
+    def create_events(self, specs: List[Dict[str, Any]]) -> List[AuditEvent]:
+        """
+        Create and append several events as one contiguous log write.
         
+        Each spec holds the keyword arguments create_event() takes.
+        """
         events = []
-        with open(self.log_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    events.append(AuditEvent.model_validate_json(line))
+        for spec in specs:
+            self._event_counter += 1
+            events.append(AuditEvent(event_id=f"A-{self._event_counter:06d}", **spec))
+        if not events:
+            return events
+        
+        self._submit(events)
         return events
     
+    def flush(self) -> None:
+        """Write any pending events to disk."""
+        self._sink.flush()
+    
+    def close(self) -> None:
+        """Flush pending events and release the log file."""
+        self._finalizer.detach()
+        self._sink.close()
+    
+    def _iter_lines(self) -> Iterator[bytes]:
+        """Yield non-empty raw JSONL lines."""
+        self._sink.flush()
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap rejects empty files
+            # Map the file and let readline scan for newlines in C
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if line.strip():
+                        yield line
+    
+    def _iter_events(self) -> Iterator[AuditEvent]:
+        """Stream events from log without materializing the whole file."""
+        for line in self._iter_lines():
+            yield _EVENT_ADAPTER.validate_json(line)
+    
+    def read_all(self) -> List[AuditEvent]:
+        """Read all events from log."""
+        return list(self._iter_events())
+    
     def query_by_glyph(self, glyph_id: str) -> List[AuditEvent]:
         """Get all events for a specific glyph (Gap #3 - archaeology)."""
-        return [e for e in self.read_all() if e.glyph_id == glyph_id]
+        self._ensure_index()
+        return list(self._by_glyph.get(glyph_id, ()))
     
     def query_by_type(self, event_type: AuditEventType) -> List[AuditEvent]:
         """Get all events of a specific type."""
-        return [e for e in self.read_all() if e.event_type == event_type]
+        return [e for e in self._iter_events() if e.event_type == event_type]
     
     def query_by_timerange(
         self,
         start: datetime,
         end: Optional[datetime] = None,
     ) -> List[AuditEvent]:
-        """Get events within time range."""
+        """Get events within time range (binary search on the index)."""
         if end is None:
             end = datetime.utcnow()
-        return [e for e in self.read_all() if start <= e.timestamp <= end]
+        self._ensure_index()
+        lo = bisect_left(self._timestamps, start)
+        hi = bisect_right(self._timestamps, end)
+        return self._events_in_order[lo:hi]
     
     def reconstruct_glyph_history(self, glyph_id: str) -> Dict[str, Any]:
         """
@@ -154,18 +438,20 @@ class AuditLog:
         }
         
         for event in sorted(events, key=lambda e: e.timestamp):
+            # Enum members are singletons: identity beats str.__eq__
+            event_type = event.event_type
             timeline_entry = {
                 "event_id": event.event_id,
-                "type": event.event_type.value,
+                "type": event_type.value,
                 "timestamp": event.timestamp.isoformat(),
                 "reason": event.reason,
                 "source": event.source,
             }
             history["timeline"].append(timeline_entry)
             
-            if event.event_type == AuditEventType.CREATED:
+            if event_type is AuditEventType.CREATED:
                 history["creation_event"] = timeline_entry
-            elif event.event_type == AuditEventType.MUTATED:
+            elif event_type is AuditEventType.MUTATED:
                 history["mutations"].append(timeline_entry)
             
             if event.after_state:
@@ -174,29 +460,23 @@ class AuditLog:
         return history
     
     def generate_summary(self) -> Dict[str, Any]:
-        """Generate audit summary for reporting."""
-        events = self.read_all()
-        
-        summary = {
-            "total_events": len(events),
-            "by_type": {},
-            "by_glyph": {},
-            "rejected_count": 0,
-            "validation_failures": 0,
-        }
+        """
+        Generate audit summary for reporting.
         
-        for event in events:
-            # Count by type
-            type_key = event.event_type.value
-            summary["by_type"][type_key] = summary["by_type"].get(type_key, 0) + 1
-            
-            # Count by glyph
-            summary["by_glyph"][event.glyph_id] = summary["by_glyph"].get(event.glyph_id, 0) + 1
-            
-            # Count failures
-            if event.event_type == AuditEventType.REJECTED:
-                summary["rejected_count"] += 1
-            if event.event_type == AuditEventType.VALIDATION_FAILED:
-                summary["validation_failures"] += 1
+        Built from the in-memory Counters and cached until the next
+        append, so repeated reports are O(1). Treat the result as
+        read-only.
+        """
+        self._ensure_index()
+        if self._summary_cache is not None:
+            return self._summary_cache
         
-        return summary
+        by_type = self._by_type
+        self._summary_cache = {
+            "total_events": sum(by_type.values()),
+            "by_type": {t.value: n for t, n in by_type.items()},
+            "by_glyph": {gid: len(events) for gid, events in self._by_glyph.items()},
+            "rejected_count": by_type[AuditEventType.REJECTED],
+            "validation_failures": by_type[AuditEventType.VALIDATION_FAILED],
+        }
+        return self._summary_cache
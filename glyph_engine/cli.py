@@ -11,20 +11,21 @@ Usage:
     glyph export --format json
 """
 
-import argparse
 import json
 import sys
 from pathlib import Path
-from datetime import datetime
+from types import SimpleNamespace
 
 # Add parent to path for local development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from glyph_engine import create_engine, CommandVerb
+# Engine-backed commands import it locally: `hash` and `verify` never
+# need pydantic, and import time dominates a short-lived CLI.
 
 
 def cmd_state(args):
     """Create a state glyph."""
+    from glyph_engine.engine import create_engine
     engine = create_engine()
     response = engine.process_input({
         "type": "state",
@@ -44,6 +45,7 @@ def cmd_state(args):
 
 def cmd_remember(args):
     """Create a persistent glyph."""
+    from glyph_engine.engine import create_engine
     engine = create_engine()
     response = engine.process_input({
         "type": "command",
@@ -64,6 +66,7 @@ def cmd_remember(args):
 
 def cmd_forget(args):
     """Remove a glyph."""
+    from glyph_engine.engine import create_engine
     engine = create_engine()
     response = engine.process_input({
         "type": "command",
@@ -81,6 +84,7 @@ def cmd_forget(args):
 
 def cmd_audit(args):
     """Show audit report."""
+    from glyph_engine.engine import create_engine
     engine = create_engine()
     response = engine.process_input({
         "type": "command",
@@ -93,28 +97,24 @@ def cmd_audit(args):
 
 def cmd_list(args):
     """List active glyphs."""
+    from glyph_engine.engine import create_engine
     engine = create_engine()
     print(engine.get_all_text())
 
 
 def cmd_verify(args):
     """Verify a Beacon ID."""
-    registry_path = Path(__file__).parent.parent / "beacon_registry" / "BEACON_REGISTRY.yaml"
+    from glyph_engine.registry import DEFAULT_REGISTRY_PATH, load_registry
+    registry_path = DEFAULT_REGISTRY_PATH
     
     if not registry_path.exists():
         print("❌ Beacon registry not found", file=sys.stderr)
         sys.exit(1)
     
-    import yaml
-    with open(registry_path) as f:
-        registry = yaml.safe_load(f)
+    view = load_registry(registry_path)
     
     beacon_id = args.beacon_id
-    found = None
-    for beacon in registry.get("beacons", []):
-        if beacon.get("beacon_id") == beacon_id:
-            found = beacon
-            break
+    found = view.by_id.get(beacon_id)
     
     if found:
         print(f"""
@@ -137,6 +137,7 @@ DOI:      {found.get('doi', 'N/A')}
 
 def cmd_export(args):
     """Export glyphs or registry."""
+    from glyph_engine.engine import create_engine
     engine = create_engine()
     summary = engine.get_state_summary()
     
@@ -151,16 +152,14 @@ def cmd_export(args):
 
 def cmd_hash(args):
     """Show registry hash for verification."""
-    import hashlib
-    registry_path = Path(__file__).parent.parent / "beacon_registry" / "BEACON_REGISTRY.yaml"
+    from glyph_engine.registry import DEFAULT_REGISTRY_PATH, file_sha256
+    registry_path = DEFAULT_REGISTRY_PATH
     
     if not registry_path.exists():
         print("❌ Beacon registry not found", file=sys.stderr)
         sys.exit(1)
     
-    with open(registry_path, "rb") as f:
-        content = f.read()
-        hash_value = hashlib.sha256(content).hexdigest()
+    hash_value = file_sha256(registry_path)
     
     print(f"""
 ⟡ REGISTRY INTEGRITY CHECK
@@ -172,7 +171,27 @@ Compare with GOVERNANCE_LOCK.md checkpoint
 """)
 
 
+def _fast_dispatch(argv) -> bool:
+    """
+    Run the script-friendly `hash` / `verify <id>` forms directly.
+    
+    Skips importing argparse and building the parser tree. Any other
+    shape (extra args, flags, --help) falls through to argparse.
+    """
+    if argv == ["hash"]:
+        cmd_hash(SimpleNamespace())
+        return True
+    if len(argv) == 2 and argv[0] == "verify" and not argv[1].startswith("-"):
+        cmd_verify(SimpleNamespace(beacon_id=argv[1]))
+        return True
+    return False
+
+
 def main():
+    if _fast_dispatch(sys.argv[1:]):
+        return
+    
+    import argparse
     parser = argparse.ArgumentParser(
         prog="glyph",
         description="⟡ Glyph Engine CLI — Symbolic control interface",
@@ -12,19 +12,78 @@ The central control system that:
 This is a CONTROL SYSTEM, not a memory system.
 """
 
-from typing import Dict, Optional, List, Any, Tuple
-from datetime import datetime
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, Optional, List, Any, Tuple, Union
+from datetime import datetime, timezone
 from pathlib import Path
-from pydantic import BaseModel, Field
+from operator import attrgetter
+from pydantic import BaseModel, ConfigDict, Field
+import heapq
+import itertools
+import time
 import uuid
 
 from glyph_engine.token import GlyphToken, GlyphClass, GlyphVector, GENESIS_GLYPHS
-from glyph_engine.input import InputMessage, InputType, CommandVerb, InputParser
+from glyph_engine.input import (
+    AuthenticationError,
+    CommandVerb,
+    InputMessage,
+    InputParser,
+    InputType,
+)
 from glyph_engine.scroll import Scroll, MutationType, GENESIS_SCROLL, STANDARD_SCROLL
 from glyph_engine.validator import ValidatorEngine, ValidatorResult, ValidationAction
 from glyph_engine.audit import AuditLog, AuditEventType
 from glyph_engine.store import GlyphStore
 
+# Entries kept in each engine's validation cache (LRU)
+VALIDATOR_CACHE_SIZE = 1024
+
+# Layout of the full audit report (filled by _cmd_audit)
+_AUDIT_REPORT_TEMPLATE = """\
+⟡ GLYPH ENGINE AUDIT REPORT
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Session: {session_id}
+Active Glyphs: {active_glyphs}
+Expired: {expired_glyphs}
+Total Events: {total_events}
+Rejections: {rejected_count}
+Validation Failures: {validation_failures}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"""
+
+# Payload keys a reframe can change
+_REFRAME_FIELDS = frozenset({"class", "explanation", "intensity"})
+
+# Sort key for rendering glyphs strongest-first
+_by_intensity = attrgetter("intensity")
+
+# Built-in scrolls, used when the store has no scroll with that ID
+_DEFAULT_SCROLLS = {"S-000": GENESIS_SCROLL, "S-001": STANDARD_SCROLL}
+
+# Accretion checks between re-counts of the store (guards counter drift)
+ACCRETION_RECONCILE_EVERY = 256
+
+
+# (monotonic ns, naive UTC datetime) of the last clock read for _now()
+_last_now: Tuple[int, datetime] = (-(10 ** 18), datetime.min)
+
+
+def _now() -> datetime:
+    """
+    Naive UTC time, reused for up to 1 ms.
+    
+    Only for response timestamps; audit events keep exact timestamps.
+    """
+    global _last_now
+    mono = time.monotonic_ns()
+    last_mono, last_dt = _last_now
+    if mono - last_mono < 1_000_000:
+        return last_dt
+    dt = datetime.now(timezone.utc).replace(tzinfo=None)
+    _last_now = (mono, dt)
+    return dt
+
 
 class EngineConfig(BaseModel):
     """Configuration for the Glyph Engine."""
@@ -37,12 +96,14 @@ class EngineConfig(BaseModel):
 
 class EngineResponse(BaseModel):
     """Response from engine operations."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     success: bool
     message: str
     glyph_id: Optional[str] = None
     validation_results: Optional[List[Dict[str, Any]]] = None
     text_output: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now)
 
 
 class GlyphEngine:
@@ -62,64 +123,143 @@ class GlyphEngine:
         self.audit = AuditLog(self.config.vault_path / "audit.jsonl")
         self.validator = ValidatorEngine()
         
-        # Load scrolls
+        # Scrolls are loaded on first use (see _get_scroll)
         self._scrolls: Dict[str, Scroll] = {}
-        self._load_scrolls()
         
         # Active session
         self.session_id = str(uuid.uuid4())[:8]
-        self._glyph_counter = 0
+        self._glyph_ids = itertools.count(1)
         self._mutation_history: Dict[str, List[Dict[str, Any]]] = {}
-    
-    def _load_scrolls(self) -> None:
-        """Load scrolls from store."""
-        for scroll_id in self.store.list_scrolls():
-            scroll = self.store.load_scroll(scroll_id)
-            if scroll:
-                self._scrolls[scroll_id] = scroll
-        
-        # Ensure defaults exist
-        if "S-000" not in self._scrolls:
-            self._scrolls["S-000"] = GENESIS_SCROLL
-        if "S-001" not in self._scrolls:
-            self._scrolls["S-001"] = STANDARD_SCROLL
+        self._validator_cache: "OrderedDict[tuple, Optional[ValidatorResult]]" = OrderedDict()
+        
+        # Stored glyph count for the accretion check; kept current by the
+        # create/forget/decay paths and re-counted periodically
+        self._active_count = len(self.store.list_glyphs())
+        self._accretion_checks = 0
+        
+        # Routing tables (one dict lookup per input / command)
+        self._input_dispatch = {
+            InputType.FACT: self._handle_fact,
+            InputType.STATE: self._handle_state,
+            InputType.COMMAND: self._handle_command,
+        }
+        self._cmd_dispatch = {
+            CommandVerb.REMEMBER: self._cmd_remember,
+            CommandVerb.FORGET: self._cmd_forget,
+            CommandVerb.REFRAME: self._cmd_reframe,
+            CommandVerb.AUDIT: self._cmd_audit,
+            CommandVerb.REFRESH: self._cmd_refresh,
+            CommandVerb.ATTENUATE: self._cmd_attenuate,
+        }
     
     def _generate_glyph_id(self) -> str:
         """Generate unique glyph ID."""
-        self._glyph_counter += 1
-        return f"G-{self._glyph_counter:03d}"
+        return f"G-{next(self._glyph_ids):03d}"
     
     def _get_scroll(self, scroll_id: str = "S-001") -> Scroll:
-        """Get scroll by ID, default to standard."""
-        return self._scrolls.get(scroll_id, STANDARD_SCROLL)
+        """
+        Get scroll by ID, default to standard.
+        
+        Stored scrolls take precedence over the built-in defaults; each ID
+        is resolved from the store once and then memoized.
+        """
+        scroll = self._scrolls.get(scroll_id)
+        if scroll is None:
+            scroll = (
+                self.store.load_scroll(scroll_id)
+                or _DEFAULT_SCROLLS.get(scroll_id, STANDARD_SCROLL)
+            )
+            self._scrolls[scroll_id] = scroll
+        return scroll
+    
+    @staticmethod
+    def _snapshot(glyph: GlyphToken) -> Dict[str, Any]:
+        """
+        Dump a glyph for an audit before/after state.
+        
+        Take each snapshot once and share it; nothing downstream mutates it.
+        """
+        return glyph.model_dump()
+    
+    def _validate_new_glyph(
+        self,
+        glyph: GlyphToken,
+        source: str,
+        authenticated: bool,
+    ) -> Optional[ValidatorResult]:
+        """
+        Run V-01 on a new glyph: the first failure, or None if it passes.
+        
+        Memoized on the inputs V-01's checks declare (see
+        ValidatorEngine.memo_key). A cached failure is re-stamped, so it
+        reports when this glyph was validated.
+        """
+        context = {
+            "glyph": glyph,
+            "mutation": None,
+            "source": source,
+            "authenticated": authenticated,
+            "history": (),
+        }
+        key = self.validator.memo_key("V-01", context)
+        if key is None:
+            return self.validator.validate_transition_fast("V-01", context)
+        
+        cache = self._validator_cache
+        if key in cache:
+            cache.move_to_end(key)
+            failure = cache[key]
+            if failure is not None:
+                failure = replace(failure, timestamp=datetime.utcnow())
+            return failure
+        
+        failure = self.validator.validate_transition_fast("V-01", context)
+        cache[key] = failure
+        if len(cache) > VALIDATOR_CACHE_SIZE:
+            cache.popitem(last=False)
+        return failure
     
     def _check_accretion(self) -> bool:
-        """Check if we're at glyph limit (Gap #7.1)."""
-        active_count = len(self.store.get_active_glyphs())
-        return active_count < self.config.max_active_glyphs
+        """
+        Check if we're at glyph limit (Gap #7.1).
+        
+        Called right after a decay cycle, when every stored glyph is
+        active, so the maintained stored-glyph count is the active count.
+        """
+        self._accretion_checks += 1
+        if self._accretion_checks % ACCRETION_RECONCILE_EVERY == 0:
+            self._active_count = len(self.store.list_glyphs())
+        return self._active_count < self.config.max_active_glyphs
     
     def _run_decay_cycle(self) -> List[str]:
         """Run decay on expired glyphs."""
         expired = self.store.get_expired_glyphs()
         removed = []
+        events = []
         
         for glyph_id, glyph in expired.items():
-            self.store.delete_glyph(glyph_id)
-            self.audit.create_event(
-                event_type=AuditEventType.EXPIRED,
-                glyph_id=glyph_id,
-                reason=f"TTL expired at {glyph.expires_at}",
-                source="system",
-                session_id=self.session_id,
-                before_state=glyph.model_dump(),
-            )
+            if self.store.delete_glyph(glyph_id):
+                self._active_count -= 1
+            events.append({
+                "event_type": AuditEventType.EXPIRED,
+                "glyph_id": glyph_id,
+                "reason": f"TTL expired at {glyph.expires_at}",
+                "source": "system",
+                "session_id": self.session_id,
+                "before_state": self._snapshot(glyph),
+            })
             removed.append(glyph_id)
         
+        # One contiguous audit write for the whole cycle
+        self.audit.create_events(events)
         return removed
     
     # ==================== PUBLIC API ====================
     
-    def process_input(self, raw_input: Dict[str, Any]) -> EngineResponse:
+    def process_input(
+        self,
+        raw_input: Union[Dict[str, Any], InputMessage],
+    ) -> EngineResponse:
         """
         Main entry point - process typed input.
         
@@ -127,29 +267,41 @@ class GlyphEngine:
         - {"type": "fact", "payload": {...}}
         - {"type": "state", "payload": {...}}
         - {"type": "command", "verb": "remember", ...}
+        - An already-built InputMessage (e.g. typed by MirrorGate), which
+          skips re-parsing. It was validated on construction; with
+          enable_fast_path off its command fields are re-checked.
         """
-        try:
-            msg = InputParser.parse(raw_input)
-        except ValueError as e:
-            return EngineResponse(
-                success=False,
-                message=f"Invalid input: {e}",
-            )
-        
-        # Check authentication (Gap #2)
-        if self.config.require_auth and not msg.is_authenticated():
-            return EngineResponse(
-                success=False,
-                message="Authentication required",
-            )
+        # Authentication (Gap #2) is enforced by the parser for raw input
+        if isinstance(raw_input, InputMessage):
+            msg = raw_input
+            if not self.config.enable_fast_path and not msg.validate_command():
+                return EngineResponse(
+                    success=False,
+                    message=f"Invalid input: missing required fields for {msg.command_verb}",
+                )
+            if self.config.require_auth and not msg.is_authenticated():
+                return EngineResponse(
+                    success=False,
+                    message="Authentication required",
+                )
+        else:
+            try:
+                msg = InputParser.parse(raw_input, require_auth=self.config.require_auth)
+            except AuthenticationError:
+                return EngineResponse(
+                    success=False,
+                    message="Authentication required",
+                )
+            except ValueError as e:
+                return EngineResponse(
+                    success=False,
+                    message=f"Invalid input: {e}",
+                )
         
         # Route by input type
-        if msg.input_type == InputType.FACT:
-            return self._handle_fact(msg)
-        elif msg.input_type == InputType.STATE:
-            return self._handle_state(msg)
-        elif msg.input_type == InputType.COMMAND:
-            return self._handle_command(msg)
+        handler = self._input_dispatch.get(msg.input_type)
+        if handler is not None:
+            return handler(msg)
         
         return EngineResponse(
             success=False,
@@ -188,69 +340,64 @@ class GlyphEngine:
         
         # Create state glyph
         glyph_id = self._generate_glyph_id()
+        pget = msg.payload.get
+        source = msg.source
         
         # Determine glyph class from payload
-        glyph_class = GlyphClass(msg.payload.get("class", "anchor"))
+        glyph_class = GlyphClass(pget("class", "anchor"))
         
         # Build vector from payload or defaults
         vector = GlyphVector(
-            x=msg.payload.get("urgency", 0.0),
-            y=msg.payload.get("complexity", 0.0),
-            z=msg.payload.get("alignment", 0.5),
+            x=pget("urgency", 0.0),
+            y=pget("complexity", 0.0),
+            z=pget("alignment", 0.5),
         )
         
         glyph = GlyphToken(
             glyph_id=glyph_id,
             glyph_class=glyph_class,
             vector=vector,
-            intensity=msg.payload.get("intensity", 0.5),
-            source=msg.source,
-            owner=msg.payload.get("owner", "paul"),
-            ttl_seconds=msg.payload.get("ttl", self.config.default_ttl_seconds),
-            explanation=msg.payload.get("explanation", "User-declared state"),
-            parent_id=msg.payload.get("parent_id"),
+            intensity=pget("intensity", 0.5),
+            source=source,
+            owner=pget("owner", "paul"),
+            ttl_seconds=pget("ttl", self.config.default_ttl_seconds),
+            explanation=pget("explanation", "User-declared state"),
+            parent_id=pget("parent_id"),
         )
         
         # Validate
-        results = self.validator.validate_transition(
-            validator_id="V-01",
-            context={
-                "glyph": glyph,
-                "mutation": None,
-                "source": msg.source,
-                "authenticated": msg.is_authenticated(),
-                "history": [],
-            },
-        )
-        
-        # Check for failures
-        failed = [r for r in results if not r.passed]
-        if failed:
+        failure = self._validate_new_glyph(glyph, source, msg.is_authenticated())
+        if failure is not None:
+            # One dump shared by the audit event and the response
+            dumped_results = [failure.to_dict()]
             self.audit.create_event(
                 event_type=AuditEventType.VALIDATION_FAILED,
                 glyph_id=glyph_id,
-                reason=failed[0].message,
-                source=msg.source,
+                reason=failure.message,
+                source=source,
                 session_id=self.session_id,
-                validation_results=[r.model_dump() for r in results],
+                validation_results=dumped_results,
             )
             return EngineResponse(
                 success=False,
-                message=f"Validation failed: {failed[0].message}",
-                validation_results=[r.model_dump() for r in results],
+                message=f"Validation failed: {failure.message}",
+                validation_results=dumped_results,
             )
         
         # Save glyph
+        is_new = not self.store.has_glyph(glyph_id)
         self.store.save_glyph(glyph)
+        if is_new:
+            self._active_count += 1
         
         # Audit
         self.audit.create_event(
             event_type=AuditEventType.CREATED,
             glyph_id=glyph_id,
             reason="State glyph created",
-            source=msg.source,
+            source=source,
             session_id=self.session_id,
-            after_state=glyph.model_dump(),
+            after_state=self._snapshot(glyph),
         )
         
         return EngineResponse(
@@ -264,18 +411,9 @@ class GlyphEngine:
         """Handle explicit command verbs."""
         verb = msg.command_verb
         
-        if verb == CommandVerb.REMEMBER:
-            return self._cmd_remember(msg)
-        elif verb == CommandVerb.FORGET:
-            return self._cmd_forget(msg)
-        elif verb == CommandVerb.REFRAME:
-            return self._cmd_reframe(msg)
-        elif verb == CommandVerb.AUDIT:
-            return self._cmd_audit(msg)
-        elif verb == CommandVerb.REFRESH:
-            return self._cmd_refresh(msg)
-        elif verb == CommandVerb.ATTENUATE:
-            return self._cmd_attenuate(msg)
+        handler = self._cmd_dispatch.get(verb)
+        if handler is not None:
+            return handler(msg)
         
         return EngineResponse(
             success=False,
@@ -284,8 +422,10 @@ class GlyphEngine:
     
     def _cmd_remember(self, msg: InputMessage) -> EngineResponse:
         """Create persistent glyph."""
-        # Similar to state but with longer TTL
-        msg.payload["ttl"] = msg.payload.get("ttl", 604800)  # 7 days
+        # Similar to state but with longer TTL; copy rather than mutate
+        # the (frozen) message or the caller's payload dict
+        if "ttl" not in msg.payload:
+            msg = msg.model_copy(update={"payload": {**msg.payload, "ttl": 604800}})  # 7 days
         return self._handle_state(msg)
     
     def _cmd_forget(self, msg: InputMessage) -> EngineResponse:
@@ -300,14 +440,15 @@ class GlyphEngine:
             )
         
         # Delete and audit
-        self.store.delete_glyph(glyph_id)
+        if self.store.delete_glyph(glyph_id):
+            self._active_count -= 1
         self.audit.create_event(
             event_type=AuditEventType.FORGOTTEN,
             glyph_id=glyph_id,
             reason=msg.payload.get("reason", "User requested forget"),
             source=msg.source,
             session_id=self.session_id,
-            before_state=glyph.model_dump(),
+            before_state=self._snapshot(glyph),
         )
         
         return EngineResponse(
@@ -328,17 +469,8 @@ class GlyphEngine:
                 message=f"Glyph not found: {glyph_id}",
             )
         
-        before_state = glyph.model_dump()
-        
-        # Apply reframe
-        if "class" in msg.payload:
-            glyph.glyph_class = GlyphClass(msg.payload["class"])
-        if "explanation" in msg.payload:
-            glyph.explanation = msg.payload["explanation"]
-        if "intensity" in msg.payload:
-            glyph.intensity = msg.payload["intensity"]
-        
-        # Validate transformation
+        # Validate transformation; checked before the no-op shortcut, so a
+        # forbidden reframe is refused even when it would change nothing
         scroll = self._get_scroll()
         if not scroll.is_mutation_allowed(MutationType.TRANSFORM):
             return EngineResponse(
@@ -346,6 +478,26 @@ class GlyphEngine:
                 message="Transform not allowed in current scroll",
             )
         
+        # Nothing to change: skip the snapshots, store write and audit
+        payload = msg.payload
+        if _REFRAME_FIELDS.isdisjoint(payload):
+            return EngineResponse(
+                success=True,
+                message=f"No-op reframe: {glyph_id}",
+                glyph_id=glyph_id,
+                text_output=glyph.to_text(),
+            )
+        
+        before_state = self._snapshot(glyph)
+        
+        # Apply reframe
+        if "class" in payload:
+            glyph.glyph_class = GlyphClass(payload["class"])
+        if "explanation" in payload:
+            glyph.explanation = payload["explanation"]
+        if "intensity" in payload:
+            glyph.intensity = payload["intensity"]
+        
         # Save and audit
         self.store.save_glyph(glyph)
         self.audit.create_event(
@@ -355,7 +507,7 @@ class GlyphEngine:
             source=msg.source,
             session_id=self.session_id,
             before_state=before_state,
-            after_state=glyph.model_dump(),
+            after_state=self._snapshot(glyph),
         )
         
         return EngineResponse(
@@ -380,21 +532,15 @@ class GlyphEngine:
             summary = self.audit.generate_summary()
             store_stats = self.store.get_stats()
             
-            report = f"""
-⟡ GLYPH ENGINE AUDIT REPORT
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Session: {self.session_id}
-Active Glyphs: {store_stats['active_glyphs']}
-Expired: {store_stats['expired_glyphs']}
-Total Events: {summary['total_events']}
-Rejections: {summary['rejected_count']}
-Validation Failures: {summary['validation_failures']}
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
+            report = _AUDIT_REPORT_TEMPLATE.format_map({
+                **summary,
+                **store_stats,
+                "session_id": self.session_id,
+            })
             return EngineResponse(
                 success=True,
                 message="Audit complete",
-                text_output=report.strip(),
+                text_output=report,
             )
     
     def _cmd_refresh(self, msg: InputMessage) -> EngineResponse:
@@ -408,7 +554,7 @@ Validation Failures: {summary['validation_failures']}
                 message=f"Glyph not found: {glyph_id}",
             )
         
-        before_state = glyph.model_dump()
+        before_state = self._snapshot(glyph)
         additional = msg.payload.get("seconds", 86400)
         glyph.refresh(additional)
         
@@ -420,7 +566,7 @@ Validation Failures: {summary['validation_failures']}
             source=msg.source,
             session_id=self.session_id,
             before_state=before_state,
-            after_state=glyph.model_dump(),
+            after_state=self._snapshot(glyph),
         )
         
         return EngineResponse(
@@ -441,8 +587,24 @@ Validation Failures: {summary['validation_failures']}
                 message=f"Glyph not found: {glyph_id}",
             )
         
-        before_state = glyph.model_dump()
+        # Checked before the no-op shortcut, as for reframe
+        if not self._get_scroll().is_mutation_allowed(MutationType.ATTENUATE):
+            return EngineResponse(
+                success=False,
+                message="Attenuate not allowed in current scroll",
+            )
+        
         factor = msg.payload.get("factor", 0.9)
+        if factor == 1.0:
+            # Intensity is unchanged; nothing to store or audit
+            return EngineResponse(
+                success=True,
+                message=f"No-op attenuate: {glyph_id}",
+                glyph_id=glyph_id,
+                text_output=glyph.to_text(),
+            )
+        
+        before_state = self._snapshot(glyph)
         glyph.attenuate(factor)
         
         self.store.save_glyph(glyph)
@@ -453,7 +615,7 @@ Validation Failures: {summary['validation_failures']}
             source=msg.source,
             session_id=self.session_id,
             before_state=before_state,
-            after_state=glyph.model_dump(),
+            after_state=self._snapshot(glyph),
         )
         
         return EngineResponse(
@@ -478,7 +640,7 @@ Validation Failures: {summary['validation_failures']}
                     "id": g.glyph_id,
                     "class": g.glyph_class.value,
                     "intensity": g.intensity,
-                    "expires": g.expires_at.isoformat() if g.expires_at else None,
+                    "expires": g.expires_iso(),
                     "explain": g.explanation,
                 }
                 for g in active.values()
@@ -493,12 +655,18 @@ Validation Failures: {summary['validation_failures']}
             return glyph.to_text()
         return None
     
-    def get_all_text(self) -> str:
-        """Get all glyphs as text (for LLM context injection)."""
-        active = self.store.get_active_glyphs()
-        lines = ["⟡ ACTIVE GLYPHS:"]
-        for glyph in sorted(active.values(), key=lambda g: g.intensity, reverse=True):
-            lines.append(f"  • {glyph.to_text()}")
+    def get_all_text(self, top_k: Optional[int] = None) -> str:
+        """
+        Get glyphs as text, strongest first (for LLM context injection).
+        
+        Pass top_k to render only the K most intense glyphs.
+        """
+        active = self.store.get_active_glyphs().values()
+        if top_k is not None:
+            ordered = heapq.nlargest(top_k, active, key=_by_intensity)
+        else:
+            ordered = sorted(active, key=_by_intensity, reverse=True)
+        lines = ["⟡ ACTIVE GLYPHS:", *[f"  • {g.to_text()}" for g in ordered]]
         return "\n".join(lines)
 
 
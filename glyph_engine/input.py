@@ -12,7 +12,18 @@ No implicit inference - all inputs must be explicitly typed.
 from enum import Enum
 from typing import Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    model_validator,
+)
+
+
+class AuthenticationError(ValueError):
+    """Input lacks the auth context required by the parser (Gap #2)."""
 
 
 class InputType(str, Enum):
@@ -32,21 +43,50 @@ class CommandVerb(str, Enum):
     ATTENUATE = "attenuate" # Reduce intensity
 
 
+# Verbs that act on an existing glyph and so need target_glyph_id
+_VERBS_REQUIRING_TARGET = frozenset({
+    CommandVerb.FORGET,
+    CommandVerb.REFRAME,
+    CommandVerb.REFRESH,
+    CommandVerb.ATTENUATE,
+})
+
+
+# Top-level keys InputParser.parse reads; any others in a raw message are
+# ignored, as they always have been
+_RAW_FIELDS = frozenset({
+    "type", "payload", "source", "timestamp",
+    "verb", "target", "auth_token", "session_id",
+})
+
+
 class InputMessage(BaseModel):
     """
     Typed input to the Glyph Engine.
     
     Every input must have an explicit type.
     Commands require explicit verbs.
+    Unknown fields are rejected when building a message directly
+    (InputParser.parse ignores them); messages are immutable once parsed.
     """
-    input_type: InputType = Field(..., description="Type of input")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    input_type: InputType = Field(
+        ...,
+        validation_alias=AliasChoices("input_type", "type"),
+        description="Type of input",
+    )
     payload: Dict[str, Any] = Field(default_factory=dict)
     source: str = Field(default="user", description="Origin of input")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
     # Optional command specifics
-    command_verb: Optional[CommandVerb] = None
-    target_glyph_id: Optional[str] = None
+    command_verb: Optional[CommandVerb] = Field(
+        default=None, validation_alias=AliasChoices("command_verb", "verb"),
+    )
+    target_glyph_id: Optional[str] = Field(
+        default=None, validation_alias=AliasChoices("target_glyph_id", "target"),
+    )
     
     # Authentication (Gap #2 mitigation)
     auth_token: Optional[str] = None
@@ -62,10 +102,15 @@ class InputMessage(BaseModel):
         if self.input_type == InputType.COMMAND:
             if self.command_verb is None:
                 return False
-            if self.command_verb in [CommandVerb.FORGET, CommandVerb.REFRAME, 
-                                      CommandVerb.REFRESH, CommandVerb.ATTENUATE]:
+            if self.command_verb in _VERBS_REQUIRING_TARGET:
                 return self.target_glyph_id is not None
         return True
+    
+    @model_validator(mode="after")
+    def _check_command(self) -> "InputMessage":
+        if not self.validate_command():
+            raise ValueError(f"Invalid command: missing required fields for {self.command_verb}")
+        return self
 
 
 class InputParser:
@@ -76,29 +121,32 @@ class InputParser:
     """
     
     @staticmethod
-    def parse(raw: Dict[str, Any]) -> InputMessage:
+    def parse(raw: Dict[str, Any], require_auth: bool = False) -> InputMessage:
         """
         Parse raw dict into InputMessage.
         
-        Raises ValueError for invalid/ambiguous input.
+        Unknown top-level keys are ignored. Raises ValueError for
+        invalid/ambiguous input, and its subclass AuthenticationError when
+        require_auth is set and the message is not authenticated.
         """
         if "type" not in raw:
             raise ValueError("Input must have explicit 'type' field")
         
-        input_type = InputType(raw["type"])
-        
-        msg = InputMessage(
-            input_type=input_type,
-            payload=raw.get("payload", {}),
-            source=raw.get("source", "user"),
-            timestamp=datetime.fromisoformat(raw["timestamp"]) if "timestamp" in raw else datetime.utcnow(),
-            command_verb=CommandVerb(raw["verb"]) if "verb" in raw else None,
-            target_glyph_id=raw.get("target"),
-            auth_token=raw.get("auth_token"),
-            session_id=raw.get("session_id"),
-        )
+        if not raw.keys() <= _RAW_FIELDS:
+            raw = {key: value for key, value in raw.items() if key in _RAW_FIELDS}
         
-        if not msg.validate_command():
-            raise ValueError(f"Invalid command: missing required fields for {msg.command_verb}")
+        # Single pydantic-core pass; command requirements are checked by
+        # the model validator
+        try:
+            msg = InputMessage.model_validate(raw)
+        except ValidationError as e:
+            error = e.errors()[0]
+            cause = error.get("ctx", {}).get("error")
+            if cause is not None:
+                raise ValueError(str(cause)) from None
+            loc = ".".join(str(part) for part in error["loc"])
+            raise ValueError(f"{loc}: {error['msg']}") from None
         
+        if require_auth and not msg.is_authenticated():
+            raise AuthenticationError("Authentication required")
         return msg
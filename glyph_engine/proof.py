@@ -12,19 +12,130 @@ Implements:
 
 import hashlib
 import json
+from binascii import hexlify
+from json.encoder import encode_basestring_ascii
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 
+from glyph_engine.registry import DEFAULT_REGISTRY_PATH, file_sha256, load_registry
 
-@dataclass
-class MerkleNode:
-    """Single node in a Merkle tree."""
-    hash: str
-    left: Optional['MerkleNode'] = None
-    right: Optional['MerkleNode'] = None
-    data: Optional[str] = None  # Only for leaf nodes
+# Bound once; hashlib's OpenSSL backend already dispatches to SHA-NI /
+# ARMv8 crypto extensions where the CPU has them
+_sha256 = hashlib.sha256
+
+
+def _sha256_hex(data: str) -> str:
+    """SHA-256 of a str, as hex."""
+    return _sha256(data.encode()).hexdigest()
+
+
+def _canonical_value(value: Any) -> str:
+    """JSON for one field, exactly as json.dumps(sort_keys=True) writes it."""
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+    return json.dumps(value, sort_keys=True)  # nested dicts sorted too
+
+
+def _canonical_beacon(beacon: Dict[str, Any]) -> bytes:
+    """
+    Canonical bytes of a beacon: the four hashed fields, sorted.
+    
+    Byte-identical to json.dumps({...}, sort_keys=True) but with the
+    layout fixed up front, so no dict, sort or encoder state per leaf.
+    """
+    return (
+        '{"artifact_name": %s, "beacon_id": %s, "first_seen": %s, "scope": %s}' % (
+            _canonical_value(beacon.get("artifact_name")),
+            _canonical_value(beacon.get("beacon_id")),
+            _canonical_value(beacon.get("first_seen")),
+            _canonical_value(beacon.get("scope")),
+        )
+    ).encode()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    """Parent of two nodes held as ASCII-hex bytes, returned the same way."""
+    # Feed both halves to the hasher rather than concatenating them first
+    h = _sha256(left)
+    h.update(right)
+    return hexlify(h.digest())
+
+
+def _zero_hashes(levels: int) -> List[bytes]:
+    """Root of an all-padding subtree per level: zero[k] = H(zero[k-1] + zero[k-1])."""
+    zero = [_sha256_hex("PADDING").encode()]
+    for _ in range(levels):
+        zero.append(_node_hash(zero[-1], zero[-1]))
+    return zero
+
+
+# Padding schedule, computed once at import (covers trees up to 2**32 leaves)
+ZERO_HASHES: List[bytes] = _zero_hashes(32)
+
+
+class IncrementalMerkle:
+    """
+    Append-only Merkle accumulator.
+    
+    Keeps one pending hash per level (the frontier of the right spine)
+    instead of the whole tree: appends touch O(log N) nodes and memory is
+    O(log N). The root is identical to that of the full tree over the
+    leaves padded with H("PADDING") to a power of two, parents being
+    H(left_hex + right_hex).
+    
+    Nodes are kept as ASCII-hex bytes so the hex-concatenation scheme (and
+    therefore the published root) is preserved without str encode/decode
+    per node; conversion to str happens only at the boundary.
+    """
+    
+    def __init__(self) -> None:
+        self._frontier: List[bytes] = []
+        self._count = 0
+        self._root: Optional[str] = None
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, leaf_hash: str) -> None:
+        """Add a leaf (hex digest), merging completed subtrees up the spine."""
+        frontier = self._frontier
+        h = leaf_hash.encode()
+        level = 0
+        count = self._count
+        while count & 1:
+            h = _node_hash(frontier[level], h)
+            count >>= 1
+            level += 1
+        if level == len(frontier):
+            frontier.append(h)
+        else:
+            frontier[level] = h
+        self._count += 1
+        self._root = None
+    
+    def root(self) -> Optional[str]:
+        """Root hash (None when empty); cached until the next append."""
+        if self._root is not None or self._count == 0:
+            return self._root
+        
+        count = self._count
+        depth = (count - 1).bit_length()
+        if count & (count - 1) == 0:
+            self._root = self._frontier[depth].decode()
+            return self._root
+        
+        # Fold the frontier bottom-up, filling the right with padding
+        h: Optional[bytes] = None
+        for level in range(depth):
+            if count >> level & 1:
+                right = h if h is not None else ZERO_HASHES[level]
+                h = _node_hash(self._frontier[level], right)
+            elif h is not None:
+                h = _node_hash(h, ZERO_HASHES[level])
+        self._root = h.decode()
+        return self._root
 
 
 @dataclass  
@@ -61,70 +172,67 @@ class BeaconProof:
     """
     
     def __init__(self, registry_path: Optional[Path] = None):
-        self.registry_path = registry_path or Path(__file__).parent.parent / "beacon_registry" / "BEACON_REGISTRY.yaml"
+        self.registry_path = registry_path or DEFAULT_REGISTRY_PATH
         self._beacons: List[Dict[str, Any]] = []
-        self._root: Optional[MerkleNode] = None
+        self._tree = IncrementalMerkle()
         self._leaf_map: Dict[str, int] = {}
+        self._beacon_hashes: List[str] = []  # leaf hash per beacon, same order
+        self._beacon_by_id: Dict[str, Dict[str, Any]] = {}
+        self._tree_built = False
         
         if self.registry_path.exists():
             self._load_registry()
     
     def _load_registry(self) -> None:
-        """Load beacons from registry."""
-        import yaml
-        with open(self.registry_path) as f:
-            data = yaml.safe_load(f)
-        self._beacons = data.get("beacons", [])
-        self._build_tree()
+        """Load beacons from registry; the tree is built on first use."""
+        view = load_registry(self.registry_path)
+        self._beacons = view.beacons
+        self._beacon_by_id = view.by_id
+        self._tree_built = False
     
     def _hash(self, data: str) -> str:
         """SHA-256 hash."""
-        return hashlib.sha256(data.encode()).hexdigest()
+        return _sha256_hex(data)
     
     def _hash_beacon(self, beacon: Dict[str, Any]) -> str:
         """Deterministic hash of a beacon."""
-        # Canonical serialization
-        canonical = json.dumps({
-            "beacon_id": beacon.get("beacon_id"),
-            "scope": beacon.get("scope"),
-            "artifact_name": beacon.get("artifact_name"),
-            "first_seen": beacon.get("first_seen"),
-        }, sort_keys=True)
-        return self._hash(canonical)
+        return _sha256(_canonical_beacon(beacon)).hexdigest()
     
     def _build_tree(self) -> None:
         """Build Merkle tree from beacons."""
-        if not self._beacons:
-            return
-        
-        # Create leaf nodes
-        leaves = []
+        tree = IncrementalMerkle()
+        hashes = []
+        leaf_map = {}
         for i, beacon in enumerate(self._beacons):
             h = self._hash_beacon(beacon)
-            node = MerkleNode(hash=h, data=beacon.get("beacon_id"))
-            leaves.append(node)
-            self._leaf_map[beacon.get("beacon_id", "")] = i
-        
-        # Pad to power of 2
-        while len(leaves) & (len(leaves) - 1) != 0:
-            leaves.append(MerkleNode(hash=self._hash("PADDING")))
-        
-        # Build tree bottom-up
-        while len(leaves) > 1:
-            next_level = []
-            for i in range(0, len(leaves), 2):
-                left = leaves[i]
-                right = leaves[i + 1] if i + 1 < len(leaves) else left
-                combined = self._hash(left.hash + right.hash)
-                parent = MerkleNode(hash=combined, left=left, right=right)
-                next_level.append(parent)
-            leaves = next_level
-        
-        self._root = leaves[0] if leaves else None
+            hashes.append(h)
+            tree.append(h)
+            leaf_map[beacon.get("beacon_id", "")] = i
+        self._leaf_map = leaf_map
+        self._beacon_hashes = hashes
+        self._tree = tree
+        self._tree_built = True
+    
+    def _ensure_tree(self) -> None:
+        """Build the Merkle tree if it hasn't been built yet."""
+        if not self._tree_built:
+            self._build_tree()
+    
+    def _leaf_hash(self, beacon: Dict[str, Any], idx: int) -> str:
+        """Cached hash of the beacon at idx, hashing only if it isn't that beacon."""
+        if self._beacons[idx] is beacon:
+            return self._beacon_hashes[idx]
+        return self._hash_beacon(beacon)
+    
+    @property
+    def beacon_count(self) -> int:
+        """Number of beacons in the loaded registry."""
+        return len(self._beacons)
     
     def get_root_hash(self) -> Optional[str]:
         """Get Merkle root hash."""
-        return self._root.hash if self._root else None
+        self._ensure_tree()
+        return self._tree.root()
     
     def generate_inclusion_proof(self, beacon_id: str) -> Optional[InclusionProof]:
         """
@@ -132,32 +240,24 @@ class BeaconProof:
         
         Returns a proof that can be verified without the full registry.
         """
-        if beacon_id not in self._leaf_map:
-            return None
-        
-        # Find beacon
-        beacon = None
-        for b in self._beacons:
-            if b.get("beacon_id") == beacon_id:
-                beacon = b
-                break
+        # by_id and _leaf_map are built from the same beacon list
+        beacon = self._beacon_by_id.get(beacon_id)
+        if beacon is None:
+            return None  # misses never build the tree
         
-        if not beacon:
-            return None
-        
-        beacon_hash = self._hash_beacon(beacon)
+        self._ensure_tree()
+        idx = self._leaf_map[beacon_id]
+        beacon_hash = self._leaf_hash(beacon, idx)
         
         # Build proof path (simplified - returns node hashes)
         # In a full implementation, this would walk the tree
         proof_path: List[Tuple[str, str]] = []
         
         # For now, include sibling hashes
-        idx = self._leaf_map[beacon_id]
         sibling_idx = idx + 1 if idx % 2 == 0 else idx - 1
         
         if 0 <= sibling_idx < len(self._beacons):
-            sibling = self._beacons[sibling_idx]
-            sibling_hash = self._hash_beacon(sibling)
+            sibling_hash = self._beacon_hashes[sibling_idx]
             direction = "right" if idx % 2 == 0 else "left"
             proof_path.append((sibling_hash, direction))
         
@@ -196,15 +296,14 @@ class BeaconProof:
         if not self.registry_path.exists():
             return {"verified": False, "error": "Registry not found"}
         
-        # Compute file hash
-        with open(self.registry_path, "rb") as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        # Compute file hash (streamed; the file is never held in memory)
+        file_hash = file_sha256(self.registry_path)
         
         return {
             "verified": True,
             "file_hash": file_hash,
             "merkle_root": self.get_root_hash(),
-            "beacon_count": len(self._beacons),
+            "beacon_count": self.beacon_count,
             "timestamp": datetime.utcnow().isoformat(),
         }
     
@@ -215,30 +314,24 @@ class BeaconProof:
         This proves you know a beacon exists without revealing which one.
         Hook for future zk-SNARK/STARK integration.
         """
-        if beacon_id not in self._leaf_map:
+        beacon = self._beacon_by_id.get(beacon_id)
+        if beacon is None:
             return None
         
-        # Find beacon
-        beacon = None
-        for b in self._beacons:
-            if b.get("beacon_id") == beacon_id:
-                beacon = b
-                break
-        
-        if not beacon:
-            return None
+        self._ensure_tree()
         
         # Pedersen-style commitment (simplified)
         # In production, use proper ZKP library
-        beacon_hash = self._hash_beacon(beacon)
-        blinding = self._hash(f"{beacon_id}:{datetime.utcnow().isoformat()}")
+        beacon_hash = self._leaf_hash(beacon, self._leaf_map[beacon_id])
+        timestamp = datetime.utcnow().isoformat()  # one clock read per commitment
+        blinding = self._hash(f"{beacon_id}:{timestamp}")
         commitment = self._hash(beacon_hash + blinding)
         
         return {
             "type": "zkp_commitment_v1",
             "commitment": commitment,
             "root_hash": self.get_root_hash(),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "note": "Zero-knowledge proof of beacon membership. Verifier can confirm membership without knowing beacon_id.",
         }
 
@@ -271,13 +364,17 @@ def verify_beacon(beacon_id: str, registry_path: Optional[Path] = None) -> Dict[
     }
 
 
-def generate_verification_badge(beacon_id: str) -> str:
+def generate_verification_badge(beacon_id: str, verified: Optional[bool] = None) -> str:
     """
     Generate embeddable verification badge (shields.io compatible).
+    
+    Pass `verified` when the beacon has already been checked to skip
+    a second verification.
     """
-    result = verify_beacon(beacon_id)
+    if verified is None:
+        verified = verify_beacon(beacon_id)["verified"]
     
-    if result["verified"]:
+    if verified:
         color = "brightgreen"
         label = "verified"
     else:
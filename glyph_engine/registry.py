@@ -0,0 +1,136 @@
+"""
+⟡ Beacon Registry — Shared, cached registry loader
+
+One loader for the API, the CLI and the proof system:
+- Reads the JSON sidecar when it was baked from the current YAML,
+  otherwise the YAML (loading never writes; bake with
+  scripts/bake_registry.py)
+- Indexes beacons by ID once per load
+- Re-parses only when the registry file changes (mtime)
+
+The YAML file remains the canonical, governance-locked record.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_REGISTRY_PATH = Path(__file__).parent.parent / "beacon_registry" / "BEACON_REGISTRY.yaml"
+
+
+@dataclass(frozen=True)
+class RegistryView:
+    """Parsed registry snapshot, valid for one file mtime."""
+    beacons: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+    mtime_ns: int
+
+
+# Views memoized per path
+_cache: Dict[Path, RegistryView] = {}
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, streamed in fixed-size chunks."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when installed, stdlib otherwise."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _sidecar_bytes(data: Dict[str, Any], yaml_sha256: str) -> bytes:
+    """
+    Serialize a parsed registry into its JSON sidecar, bound to the YAML.
+    
+    Strict JSON only: data that wouldn't round-trip (e.g. unquoted YAML
+    dates) raises TypeError/ValueError instead of being stringified, so a
+    sidecar always loads to exactly what the YAML parses to.
+    """
+    return json.dumps(
+        {"yaml_sha256": yaml_sha256, "registry": data}, ensure_ascii=False,
+    ).encode()
+
+
+def _read_sidecar(json_path: Path, yaml_sha256: str) -> Optional[Dict[str, Any]]:
+    """Load a sidecar, or None when it wasn't baked from this exact YAML."""
+    try:
+        sidecar = _json_loads(json_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(sidecar, dict) or sidecar.get("yaml_sha256") != yaml_sha256:
+        return None
+    return sidecar.get("registry") or {}
+
+
+def _parse_yaml(raw: bytes) -> Dict[str, Any]:
+    """Parse registry YAML with libyaml when available."""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader) or {}
+
+
+def _parse(registry_path: Path) -> Dict[str, Any]:
+    """Parse the registry, preferring a JSON sidecar baked from the same YAML."""
+    raw = registry_path.read_bytes()
+    yaml_sha256 = hashlib.sha256(raw).hexdigest()
+    
+    json_path = registry_path.with_suffix(".json")
+    if json_path.exists():
+        data = _read_sidecar(json_path, yaml_sha256)
+        if data is not None:
+            return data
+    
+    return _parse_yaml(raw)
+
+
+def bake_sidecar(registry_path: Path = DEFAULT_REGISTRY_PATH) -> Path:
+    """
+    Write the JSON sidecar for a registry YAML and return its path.
+    
+    Raises TypeError/ValueError when the registry holds data that isn't
+    plain JSON (quote such values in the YAML).
+    """
+    raw = registry_path.read_bytes()
+    json_path = registry_path.with_suffix(".json")
+    json_path.write_bytes(_sidecar_bytes(_parse_yaml(raw), hashlib.sha256(raw).hexdigest()))
+    return json_path
+
+
+def load_registry(registry_path: Path = DEFAULT_REGISTRY_PATH) -> RegistryView:
+    """
+    Load a beacon registry.
+    
+    Prefers a JSON sidecar whose recorded SHA-256 matches the YAML (see
+    scripts/bake_registry.py); any other sidecar is ignored. The
+    result is cached until the file's mtime changes, so repeated loads
+    are a stat() plus a dict lookup.
+    """
+    mtime_ns = registry_path.stat().st_mtime_ns
+    view = _cache.get(registry_path)
+    if view is not None and view.mtime_ns == mtime_ns:
+        return view
+    
+    beacons = _parse(registry_path).get("beacons", [])
+    
+    # First registration wins, matching a front-to-back scan
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for beacon in beacons:
+        by_id.setdefault(beacon.get("beacon_id"), beacon)
+    
+    view = RegistryView(beacons=beacons, by_id=by_id, mtime_ns=mtime_ns)
+    _cache[registry_path] = view
+    return view
@@ -10,17 +10,43 @@ Storage aligns with Spec Section 5:
 Gap #8 mitigation: Transaction semantics with commit/rollback.
 """
 
-from typing import Dict, Optional, List, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from pydantic import BaseModel, Field
 import json
+import math
+import os
 import shutil
 
 from glyph_engine.token import GlyphToken, GENESIS_GLYPHS
 from glyph_engine.scroll import Scroll, GENESIS_SCROLL
 
 
+def _atomic_write(path: Path, text: str) -> None:
+    """Write via a temp file and rename, so the old inode is never modified."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _scan(directory: Path, suffix: str) -> Iterator[os.DirEntry]:
+    """Directory entries ending in suffix: one scandir, no Path objects or stats."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(suffix):
+                yield entry
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst, copying where links aren't supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
 class Transaction(BaseModel):
     """Pending transaction for atomic operations."""
     transaction_id: str
@@ -28,6 +54,8 @@ class Transaction(BaseModel):
     started_at: datetime = Field(default_factory=datetime.utcnow)
     committed: bool = False
     rolled_back: bool = False
+    # glyph_id -> whether its file existed when first touched in this tx
+    backed_up: Dict[str, bool] = Field(default_factory=dict)
 
 
 class GlyphStore:
@@ -70,8 +98,8 @@ class GlyphStore:
     
     def _ensure_genesis(self) -> None:
         """Ensure genesis glyphs and scrolls exist (Gap #1 - cold start)."""
-        existing_glyphs = list(self.glyphs_path.glob("*.json"))
-        if not existing_glyphs:
+        # Stops at the first file found
+        if not any(True for _ in self._iter_glyph_files()):
             # Bootstrap with genesis glyphs
             for glyph_id, glyph in GENESIS_GLYPHS.items():
                 self.save_glyph(glyph)
@@ -89,14 +117,10 @@ class GlyphStore:
         self._tx_counter += 1
         tx_id = f"TX-{self._tx_counter:06d}"
         
-        # Create backup of current state
+        # Backups are taken per glyph on first write (see _backup_glyph)
         tx_backup = self.backup_path / tx_id
         tx_backup.mkdir(exist_ok=True)
         
-        # Copy current glyphs to backup
-        for glyph_file in self.glyphs_path.glob("*.json"):
-            shutil.copy(glyph_file, tx_backup / glyph_file.name)
-        
         self._transaction = Transaction(transaction_id=tx_id)
         return tx_id
     
@@ -120,35 +144,54 @@ class GlyphStore:
         if self._transaction is None:
             return False
         
-        # Restore from backup
+        # Restore only the glyphs this transaction touched
         tx_backup = self.backup_path / self._transaction.transaction_id
+        for glyph_id, existed in self._transaction.backed_up.items():
+            glyph_file = self.glyphs_path / f"{glyph_id}.json"
+            if existed:
+                # The backup dir is discarded, so move rather than copy
+                backup_file = tx_backup / glyph_file.name
+                data = json.loads(backup_file.read_bytes())
+                os.replace(backup_file, glyph_file)
+                # Written by save_glyph, so already valid
+                self._glyph_cache[glyph_id] = GlyphToken.from_trusted_dict(data)
+            else:
+                glyph_file.unlink(missing_ok=True)
+                self._glyph_cache.pop(glyph_id, None)
+        
         if tx_backup.exists():
-            # Clear current glyphs
-            for glyph_file in self.glyphs_path.glob("*.json"):
-                glyph_file.unlink()
-            
-            # Restore from backup
-            for backup_file in tx_backup.glob("*.json"):
-                shutil.copy(backup_file, self.glyphs_path / backup_file.name)
-            
-            # Clean up backup
             shutil.rmtree(tx_backup)
         
         self._transaction.rolled_back = True
         self._transaction = None
         
-        # Clear cache
-        self._glyph_cache.clear()
-        
         return True
     
+    def _backup_glyph(self, glyph_id: str) -> None:
+        """
+        Back up a glyph before its first write in the open transaction.
+        
+        Hard links cost no data copy; saves replace files rather than
+        rewrite them, so a linked inode keeps its pre-transaction content.
+        """
+        tx = self._transaction
+        if tx is None or glyph_id in tx.backed_up:
+            return
+        name = f"{glyph_id}.json"
+        try:
+            _link_or_copy(self.glyphs_path / name, self.backup_path / tx.transaction_id / name)
+            existed = True
+        except FileNotFoundError:
+            existed = False
+        tx.backed_up[glyph_id] = existed
+    
     # ==================== GLYPH OPERATIONS ====================
     
     def save_glyph(self, glyph: GlyphToken) -> None:
         """Save glyph to store."""
+        self._backup_glyph(glyph.glyph_id)
         glyph_file = self.glyphs_path / f"{glyph.glyph_id}.json"
-        with open(glyph_file, "w") as f:
-            f.write(glyph.model_dump_json(indent=2))
+        _atomic_write(glyph_file, glyph.model_dump_json(indent=2))
         
         # Update cache
         self._glyph_cache[glyph.glyph_id] = glyph
@@ -166,12 +209,14 @@ class GlyphStore:
         if glyph_id in self._glyph_cache:
             return self._glyph_cache[glyph_id]
         
+        # Open directly rather than stat-then-open: one syscall on a miss.
+        # Raw bytes go straight to pydantic-core's JSON parser (no str decode).
         glyph_file = self.glyphs_path / f"{glyph_id}.json"
-        if not glyph_file.exists():
+        try:
+            data = glyph_file.read_bytes()
+        except FileNotFoundError:
             return None
-        
-        with open(glyph_file, "r") as f:
-            glyph = GlyphToken.model_validate_json(f.read())
+        glyph = GlyphToken.model_validate_json(data)
         
         # Update cache
         self._glyph_cache[glyph_id] = glyph
@@ -183,12 +228,13 @@ class GlyphStore:
         
         Note: This is LOGGED, not silent. Use audit layer to record.
         """
+        self._backup_glyph(glyph_id)
         glyph_file = self.glyphs_path / f"{glyph_id}.json"
-        if not glyph_file.exists():
+        try:
+            glyph_file.unlink()
+        except FileNotFoundError:
             return False
         
-        glyph_file.unlink()
-        
         # Remove from cache
         if glyph_id in self._glyph_cache:
             del self._glyph_cache[glyph_id]
@@ -202,31 +248,52 @@ class GlyphStore:
         
         return True
     
+    def has_glyph(self, glyph_id: str) -> bool:
+        """Check whether a glyph is stored, without loading it."""
+        if glyph_id in self._glyph_cache:
+            return True
+        return (self.glyphs_path / f"{glyph_id}.json").exists()
+    
+    def _iter_glyph_files(self) -> Iterator[os.DirEntry]:
+        """Directory entries of all stored glyph files."""
+        return _scan(self.glyphs_path, ".json")
+    
     def list_glyphs(self) -> List[str]:
         """List all glyph IDs in store."""
-        return [f.stem for f in self.glyphs_path.glob("*.json")]
+        return [e.name[:-5] for e in self._iter_glyph_files()]
+    
+    def _iter_glyphs(self) -> Iterator[Tuple[str, GlyphToken]]:
+        """Yield (id, glyph) for every stored glyph, cache first."""
+        cache = self._glyph_cache
+        for glyph_id in self.list_glyphs():
+            glyph = cache.get(glyph_id)
+            if glyph is None:
+                glyph = self.load_glyph(glyph_id)
+                if glyph is None:
+                    continue
+            yield glyph_id, glyph
     
     def get_all_glyphs(self) -> Dict[str, GlyphToken]:
         """Load all glyphs."""
-        glyphs = {}
-        for glyph_id in self.list_glyphs():
-            glyph = self.load_glyph(glyph_id)
-            if glyph:
-                glyphs[glyph_id] = glyph
-        return glyphs
+        return dict(self._iter_glyphs())
     
     def get_active_glyphs(self) -> Dict[str, GlyphToken]:
         """Get all non-expired glyphs."""
-        return {
-            gid: g for gid, g in self.get_all_glyphs().items()
-            if not g.is_expired()
-        }
+        # Single pass, one clock read; same test as GlyphToken.is_expired()
+        now = datetime.utcnow()
+        return {gid: g for gid, g in self._iter_glyphs() if not now > g.expires_at}
     
     def get_expired_glyphs(self) -> Dict[str, GlyphToken]:
         """Get all expired glyphs (for cleanup)."""
+        now = datetime.utcnow()
+        return {gid: g for gid, g in self._iter_glyphs() if now > g.expires_at}
+    
+    def vector_magnitudes(self) -> Dict[str, float]:
+        """Vector magnitude of every stored glyph, by ID."""
+        hypot = math.hypot
         return {
-            gid: g for gid, g in self.get_all_glyphs().items()
-            if g.is_expired()
+            gid: hypot(g.vector.x, g.vector.y, g.vector.z)
+            for gid, g in self._iter_glyphs()
         }
     
     # ==================== SCROLL OPERATIONS ====================
@@ -264,7 +331,7 @@ class GlyphStore:
     
     def list_scrolls(self) -> List[str]:
         """List all scroll IDs."""
-        return [f.stem for f in self.scrolls_path.glob("*.json")]
+        return [e.name[:-5] for e in _scan(self.scrolls_path, ".json")]
     
     # ==================== FACT OPERATIONS ====================
     
@@ -305,13 +372,14 @@ class GlyphStore:
     def get_stats(self) -> Dict[str, Any]:
         """Get store statistics."""
         glyphs = self.get_all_glyphs()
-        active = self.get_active_glyphs()
+        now = datetime.utcnow()
+        active = sum(1 for g in glyphs.values() if not now > g.expires_at)
         
         return {
             "total_glyphs": len(glyphs),
-            "active_glyphs": len(active),
-            "expired_glyphs": len(glyphs) - len(active),
+            "active_glyphs": active,
+            "expired_glyphs": len(glyphs) - active,
             "scrolls": len(self.list_scrolls()),
-            "facts": len(list(self.facts_path.glob("*.md"))),
+            "facts": sum(1 for _ in _scan(self.facts_path, ".md")),
             "vault_path": str(self.vault_path),
         }
@@ -15,11 +15,23 @@ Vector semantics (mechanistic, not semantic embeddings):
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 import hashlib
 import json
+import math
+import time
+
+_sha256 = hashlib.sha256
+
+# Derived-value caches on GlyphToken live in plain __slots__, outside
+# pydantic's model state, so they never affect ==, copies or dumps
+_set_slot = object.__setattr__
+
+# Naive-UTC epoch, for converting expires_at to integer microseconds
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 class GlyphClass(str, Enum):
@@ -41,7 +53,7 @@ class GlyphVector(BaseModel):
     z: float = Field(default=0.0, ge=-1.0, le=1.0, description="Alignment/Stability")
     
     def magnitude(self) -> float:
-        return (self.x**2 + self.y**2 + self.z**2) ** 0.5
+        return math.hypot(self.x, self.y, self.z)
 
 
 class GlyphToken(BaseModel):
@@ -74,14 +86,46 @@ class GlyphToken(BaseModel):
     # Linkage
     parent_id: Optional[str] = None
     
+    __slots__ = (
+        "_expires_iso",     # (expires_at object, its ISO string); stale once expires_at is rebound
+        "_expires_us",      # (expires_at object, microseconds since epoch); same rule
+        "_checksum_parts",  # (glyph_id, glyph_class, created_at, b"id:class:", b":created_iso")
+        "_checksum",        # (str(intensity), checksum) of the last checksum() call
+    )
+    
     def model_post_init(self, __context) -> None:
         """Set expiry based on TTL."""
         if self.expires_at is None:
             self.expires_at = self.created_at + timedelta(seconds=self.ttl_seconds)
     
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "GlyphToken":
+        """
+        Build from data this engine wrote itself, skipping validation.
+        
+        Only for known-valid input (e.g. our own saved JSON): field
+        constraints are not checked, only types are restored.
+        """
+        fields = dict(data)
+        fields["glyph_class"] = GlyphClass(fields["glyph_class"])
+        vector = fields.get("vector")
+        if isinstance(vector, dict):
+            fields["vector"] = GlyphVector.model_construct(**vector)
+        for key in ("created_at", "expires_at"):
+            value = fields.get(key)
+            if isinstance(value, str):
+                fields[key] = datetime.fromisoformat(value)
+        return cls.model_construct(**fields)
+    
     def is_expired(self) -> bool:
         """Check if glyph has exceeded TTL."""
-        return datetime.utcnow() > self.expires_at
+        # Integer clock read instead of building a datetime per call
+        expires_at = self.expires_at
+        cached = getattr(self, "_expires_us", None)
+        if cached is None or cached[0] is not expires_at:
+            cached = (expires_at, (expires_at - _EPOCH) // _MICROSECOND)
+            _set_slot(self, "_expires_us", cached)
+        return time.time_ns() // 1000 > cached[1]
     
     def refresh(self, additional_seconds: int = 86400) -> None:
         """Extend TTL (user action only)."""
@@ -92,14 +136,45 @@ class GlyphToken(BaseModel):
         """Reduce intensity (decay operation)."""
         self.intensity = max(0.0, self.intensity * factor)
     
+    def expires_iso(self) -> Optional[str]:
+        """ISO form of expires_at, cached until expires_at changes."""
+        expires_at = self.expires_at
+        if expires_at is None:
+            return None
+        cached = getattr(self, "_expires_iso", None)
+        if cached is not None and cached[0] is expires_at:
+            return cached[1]
+        iso = expires_at.isoformat()
+        _set_slot(self, "_expires_iso", (expires_at, iso))
+        return iso
+    
     def checksum(self) -> str:
         """SHA-256 hash for integrity verification."""
-        data = f"{self.glyph_id}:{self.glyph_class.value}:{self.intensity}:{self.created_at.isoformat()}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        # Hashes "id:class:intensity:created_iso"; only intensity normally
+        # changes, so the encoded parts around it are kept between calls
+        glyph_id, glyph_class, created_at = self.glyph_id, self.glyph_class, self.created_at
+        parts = getattr(self, "_checksum_parts", None)
+        if (parts is None or parts[0] is not glyph_id or parts[1] is not glyph_class
+                or parts[2] is not created_at):
+            parts = (
+                glyph_id, glyph_class, created_at,
+                f"{glyph_id}:{glyph_class.value}:".encode(),
+                f":{created_at.isoformat()}".encode(),
+            )
+            _set_slot(self, "_checksum_parts", parts)
+            _set_slot(self, "_checksum", None)
+        
+        intensity = str(self.intensity)
+        cached = getattr(self, "_checksum", None)
+        if cached is not None and cached[0] == intensity:
+            return cached[1]
+        digest = _sha256(parts[3] + intensity.encode() + parts[4]).digest()[:8].hex()
+        _set_slot(self, "_checksum", (intensity, digest))
+        return digest
     
     def to_text(self) -> str:
         """Resolve to plain text (governance requirement)."""
-        return f"[{self.glyph_class.value.upper()}] {self.explanation} (intensity: {self.intensity:.2f}, expires: {self.expires_at.isoformat()})"
+        return f"[{self.glyph_class.value.upper()}] {self.explanation} (intensity: {self.intensity:.2f}, expires: {self.expires_iso()})"
 
 
 # ==================== GENESIS GLYPHS ====================
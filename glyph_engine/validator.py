@@ -13,11 +13,18 @@ Key checks:
 Gap #7 mitigation: Validators are themselves checksummed.
 """
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Callable, Dict, Any
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Optional, Callable, Dict, Any, Mapping, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import hashlib
+import sys
+
+# __slots__ via dataclass needs 3.10+; older versions get plain dataclasses
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ValidationAction(str, Enum):
@@ -28,21 +35,42 @@ class ValidationAction(str, Enum):
     REQUEST_CONFIRMATION = "request_confirmation"
 
 
-class ValidatorResult(BaseModel):
-    """Result of a validation check."""
+@dataclass(frozen=True, **_SLOTS)
+class ValidatorResult:
+    """
+    Result of a validation check.
+    
+    Frozen: the engine caches and shares results between transitions.
+    """
     passed: bool
     validator_id: str
     check_name: str
     message: str
     action: ValidationAction = ValidationAction.ALLOW
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict, as pydantic's model_dump() gave for the old model."""
+        return {
+            "passed": self.passed,
+            "validator_id": self.validator_id,
+            "check_name": self.check_name,
+            "message": self.message,
+            "action": self.action,
+            "timestamp": self.timestamp,
+        }
 
 
-class ValidationCheck(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class ValidationCheck:
     """Single validation check."""
     name: str
     description: str
     is_critical: bool = False
+    
+    def __post_init__(self) -> None:
+        # Interned, so _CHECK_IMPLS lookups match on identity
+        object.__setattr__(self, "name", sys.intern(self.name))
 
 
 class Validator(BaseModel):
@@ -50,28 +78,182 @@ class Validator(BaseModel):
     Glyph transition validator.
     
     Each validator has a set of checks and a defined action on failure.
+    Immutable (checks are a tuple of frozen checks), so one instance can
+    be shared by every engine in the process.
     """
+    model_config = ConfigDict(frozen=True)
+    
     validator_id: str = Field(..., description="Unique ID (e.g., V-03)")
     name: str = Field(..., description="Human-readable name")
-    checks: List[ValidationCheck] = Field(default_factory=list)
+    checks: Tuple[ValidationCheck, ...] = ()
     on_fail: ValidationAction = Field(default=ValidationAction.HALT)
     
     # Meta-validation (Gap #7 - who validates the validator?)
     version: str = Field(default="1.0.0")
     checksum: Optional[str] = None
     
+    # Caches in plain slots, outside pydantic's model state (and its ==)
+    __slots__ = (
+        "_cached_checksum",  # (inputs of the checksum, checksum); see compute_checksum()
+        "_compiled",         # (checks tuple, ((check, impl, is_critical), ...)); see compiled()
+        "_inputs",           # (checks tuple, declared inputs or None); see inputs()
+    )
+    
     def compute_checksum(self) -> str:
         """Compute checksum for validator integrity."""
-        data = f"{self.validator_id}:{self.version}:{len(self.checks)}"
-        for check in self.checks:
-            data += f":{check.name}:{check.is_critical}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        # Memoized on everything it covers: an unchanged validator costs a
+        # tuple comparison, any tampering still forces a rehash
+        key = (
+            self.validator_id,
+            self.version,
+            tuple((check.name, check.is_critical) for check in self.checks),
+        )
+        cached = getattr(self, "_cached_checksum", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        parts = [f"{self.validator_id}:{self.version}:{len(self.checks)}".encode()]
+        parts.extend(f":{name}:{is_critical}".encode() for name, is_critical in key[2])
+        # Tamper evidence, not a commitment: BLAKE2b's native 8-byte digest
+        # gives the same 16 hex chars as truncated SHA-256, faster
+        checksum = hashlib.blake2b(b"".join(parts), digest_size=8).hexdigest()
+        object.__setattr__(self, "_cached_checksum", (key, checksum))
+        return checksum
     
     def verify_integrity(self) -> bool:
         """Verify validator hasn't been tampered with."""
         if self.checksum is None:
             return True  # No checksum set yet
         return self.compute_checksum() == self.checksum
+    
+    def compiled(self) -> Tuple[Tuple[ValidationCheck, "CheckImpl", bool], ...]:
+        """
+        Checks paired with their implementations, resolved once.
+        
+        Rebuilt only for a different checks tuple (e.g. after model_copy).
+        """
+        checks = self.checks
+        cached = getattr(self, "_compiled", None)
+        if cached is None or cached[0] is not checks:
+            impls = ValidatorEngine._CHECK_IMPLS
+            compiled = tuple(
+                (check, impls.get(check.name, _check_unknown), check.is_critical)
+                for check in checks
+            )
+            cached = (checks, compiled)
+            object.__setattr__(self, "_compiled", cached)
+        return cached[1]
+    
+    def inputs(self) -> Optional[Tuple[Optional[Callable[[Any], Any]], Tuple[str, ...]]]:
+        """
+        Context inputs the checks read: (glyph field getter, context keys).
+        
+        None when an implemented check doesn't declare its inputs, so its
+        verdicts can't be keyed on them. Rebuilt only for a different
+        checks tuple, like compiled().
+        """
+        checks = self.checks
+        cached = getattr(self, "_inputs", None)
+        if cached is None or cached[0] is not checks:
+            impls = ValidatorEngine._CHECK_IMPLS
+            declared = ValidatorEngine._CHECK_INPUTS
+            names: Optional[List[str]] = []
+            for check in checks:
+                if check.name not in impls:
+                    continue  # unimplemented checks pass without reading anything
+                if check.name not in declared:
+                    names = None
+                    break
+                names.extend(n for n in declared[check.name] if n not in names)
+            inputs = None
+            if names is not None:
+                attrs = [n[6:] for n in names if n.startswith("glyph.")]
+                inputs = (
+                    attrgetter(*attrs) if attrs else None,
+                    tuple(n for n in names if not n.startswith("glyph.")),
+                )
+            cached = (checks, inputs)
+            object.__setattr__(self, "_inputs", cached)
+        return cached[1]
+
+
+# ==================== CHECK IMPLEMENTATIONS ====================
+# Each returns None on pass, or the failing result.
+
+# Amplifications of one glyph allowed before no_recursive_amplification fails
+_AMPLIFY_LIMIT = 3
+
+# Check signature: (check, validator, glyph, source, authenticated, history,
+# mutation_counts); the context is unpacked once per transition, not per check
+CheckImpl = Callable[..., Optional[ValidatorResult]]
+
+
+def _fail(check: ValidationCheck, validator: Validator, message: str) -> ValidatorResult:
+    return ValidatorResult(
+        passed=False,
+        validator_id=validator.validator_id,
+        check_name=check.name,
+        message=message,
+        action=validator.on_fail,
+    )
+
+
+def _check_identity_fixation(check, validator, glyph, source, authenticated, history, counts):
+    # Glyphs cannot contain identity-like content
+    if glyph and "identity" in glyph.explanation.lower():
+        return _fail(check, validator, "Glyph explanation contains identity reference")
+    return None
+
+
+def _check_ttl_required(check, validator, glyph, source, authenticated, history, counts):
+    if glyph and glyph.ttl_seconds <= 0:
+        return _fail(check, validator, "Glyph has no TTL")
+    return None
+
+
+def _check_recursive_amplification(check, validator, glyph, source, authenticated, history, counts):
+    # Check if this glyph has been amplified recently. Callers that keep
+    # running counts pass them; otherwise scan history, stopping at the limit.
+    if counts is not None:
+        amplify_count = counts.get("amplify", 0)
+    else:
+        amplify_count = 0
+        for h in history:
+            if h.get("mutation") == "amplify":
+                amplify_count += 1
+                if amplify_count >= _AMPLIFY_LIMIT:
+                    break
+    if amplify_count >= _AMPLIFY_LIMIT:
+        return _fail(check, validator, "Recursive amplification detected")
+    return None
+
+
+def _check_authentication(check, validator, glyph, source, authenticated, history, counts):
+    if source == "unknown" or not authenticated:
+        return _fail(check, validator, "Unauthenticated mutation attempt")
+    return None
+
+
+def _check_max_intensity(check, validator, glyph, source, authenticated, history, counts):
+    if glyph and glyph.intensity > 1.0:
+        return _fail(check, validator, "Intensity exceeds maximum")
+    return None
+
+
+def _check_unknown(check, validator, glyph, source, authenticated, history, counts):
+    # Checks without an implementation pass
+    return None
+
+
+def _read_context(context: Dict[str, Any]) -> Tuple[Any, ...]:
+    """The context values checks read, in CheckImpl argument order."""
+    get = context.get
+    return (
+        get("glyph"),
+        get("source", "unknown"),
+        get("authenticated", False),
+        get("history", ()),
+        get("mutation_counts"),
+    )
 
 
 class ValidatorEngine:
@@ -81,208 +263,245 @@ class ValidatorEngine:
     This is the core drift prevention mechanism.
     """
     
-    def __init__(self):
-        self.validators: Dict[str, Validator] = {}
-        self._register_core_validators()
+    # check name -> implementation
+    _CHECK_IMPLS: Dict[str, CheckImpl] = {
+        "no_identity_fixation": _check_identity_fixation,
+        "ttl_required": _check_ttl_required,
+        "no_recursive_amplification": _check_recursive_amplification,
+        "authentication_required": _check_authentication,
+        "max_intensity": _check_max_intensity,
+    }
     
-    def _register_core_validators(self) -> None:
-        """Register built-in validators."""
-        # V-00: Genesis validator
-        self.validators["V-00"] = Validator(
-            validator_id="V-00",
-            name="Genesis Validator",
-            checks=[
-                ValidationCheck(
-                    name="no_identity_fixation",
-                    description="Glyphs cannot represent identity",
-                    is_critical=True,
-                ),
-                ValidationCheck(
-                    name="ttl_required",
-                    description="All glyphs must have TTL",
-                    is_critical=True,
-                ),
-            ],
-            on_fail=ValidationAction.HALT,
-        )
-        
-        # V-01: Standard session validator
-        self.validators["V-01"] = Validator(
-            validator_id="V-01",
-            name="Standard Session Validator",
-            checks=[
-                ValidationCheck(
-                    name="no_recursive_amplification",
-                    description="Cannot amplify same glyph repeatedly",
-                    is_critical=True,
-                ),
-                ValidationCheck(
-                    name="no_identity_fixation",
-                    description="Glyphs cannot represent identity",
-                    is_critical=True,
-                ),
-                ValidationCheck(
-                    name="ttl_required",
-                    description="All glyphs must have TTL",
-                    is_critical=True,
-                ),
-                ValidationCheck(
-                    name="max_intensity",
-                    description="Intensity cannot exceed 1.0",
-                    is_critical=False,
-                ),
-                ValidationCheck(
-                    name="authentication_required",
-                    description="Mutations require authenticated source",
-                    is_critical=True,
-                ),
-            ],
-            on_fail=ValidationAction.HALT,
-        )
-        
-        # V-02: Multi-agent validator (Gap #4)
-        self.validators["V-02"] = Validator(
-            validator_id="V-02",
-            name="Multi-Agent Validator",
-            checks=[
-                ValidationCheck(
-                    name="no_ownership_conflict",
-                    description="Cannot mutate glyph owned by another agent without consent",
-                    is_critical=True,
-                ),
-                ValidationCheck(
-                    name="no_race_condition",
-                    description="Check for concurrent modification attempts",
-                    is_critical=True,
-                ),
-            ],
-            on_fail=ValidationAction.REQUEST_CONFIRMATION,
-        )
-        
-        # Compute checksums
-        for v in self.validators.values():
-            v.checksum = v.compute_checksum()
+    # check name -> context inputs it reads ("glyph.<attr>" for glyph fields);
+    # see memo_key()
+    _CHECK_INPUTS: Dict[str, Tuple[str, ...]] = {
+        "no_identity_fixation": ("glyph.explanation",),
+        "ttl_required": ("glyph.ttl_seconds",),
+        "no_recursive_amplification": ("history", "mutation_counts"),
+        "authentication_required": ("source", "authenticated"),
+        "max_intensity": ("glyph.intensity",),
+    }
+    
+    def __init__(self):
+        # Core validators are immutable, built once per process and shared
+        # between engines; the public view is read-only
+        self._validators: Dict[str, Validator] = dict(_CORE_VALIDATORS)
+        self.validators: Mapping[str, Validator] = MappingProxyType(self._validators)
+        self._get = self._validators.get  # bound once, one C call per lookup
     
     def get_validator(self, validator_id: str) -> Optional[Validator]:
         """Get validator by ID."""
-        return self.validators.get(validator_id)
+        return self._get(validator_id)
     
-    def validate_transition(
-        self,
-        validator_id: str,
-        context: Dict[str, Any],
-    ) -> List[ValidatorResult]:
+    def register_validator(self, validator: Validator) -> None:
         """
-        Run all checks for a validator.
+        Add a validator, or replace the one with the same ID.
         
-        Context should contain:
-        - glyph: The glyph being validated
-        - mutation: The mutation being applied
-        - source: The source of the mutation
-        - history: Recent mutation history for the glyph
+        Validators without a checksum are sealed with one here, so later
+        tampering is caught by the integrity check.
         """
-        validator = self.get_validator(validator_id)
+        if validator.checksum is None:
+            validator = validator.model_copy(update={"checksum": validator.compute_checksum()})
+        self._validators[validator.validator_id] = validator
+    
+    def memo_key(self, validator_id: str, context: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Hashable key for memoizing a validator's verdict on a context.
+        
+        Covers the validator (ID, checksum, failure action) and exactly the
+        context inputs its checks declare. None when the verdict can't be
+        memoized: unknown or tampered validator, undeclared inputs, or
+        unhashable input values.
+        """
+        validator = self._get(validator_id)
+        if validator is None or not validator.verify_integrity():
+            return None
+        inputs = validator.inputs()
+        if inputs is None:
+            return None
+        
+        glyph_fields, keys = inputs
+        glyph = context.get("glyph")
+        key = (
+            validator_id,
+            validator.checksum,
+            validator.on_fail,
+            glyph_fields(glyph) if glyph_fields is not None and glyph is not None else None,
+            tuple(map(context.get, keys)),
+        )
+        try:
+            hash(key)
+        except TypeError:  # e.g. a non-empty history list
+            return None
+        return key
+    
+    def _preflight(self, validator_id: str) -> Tuple[Optional[Validator], Optional[ValidatorResult]]:
+        """Look up a validator and verify its integrity (Gap #7)."""
+        validator = self._get(validator_id)
         if validator is None:
-            return [ValidatorResult(
+            return None, ValidatorResult(
                 passed=False,
                 validator_id=validator_id,
                 check_name="validator_exists",
                 message=f"Validator {validator_id} not found",
                 action=ValidationAction.HALT,
-            )]
+            )
         
-        # Verify validator integrity (Gap #7)
+        # Checked on every call, as frozen models can still be forced; the
+        # memoized checksum makes an unchanged validator a tuple comparison
         if not validator.verify_integrity():
-            return [ValidatorResult(
+            return None, ValidatorResult(
                 passed=False,
                 validator_id=validator_id,
                 check_name="validator_integrity",
                 message=f"Validator {validator_id} failed integrity check",
                 action=ValidationAction.HALT,
-            )]
+            )
         
-        results = []
-        for check in validator.checks:
-            result = self._run_check(check, context, validator)
-            results.append(result)
-            
-            # Stop on critical failure
-            if not result.passed and check.is_critical:
-                break
-        
-        return results
+        return validator, None
     
-    def _run_check(
+    def validate_transition(
         self,
-        check: ValidationCheck,
+        validator_id: str,
         context: Dict[str, Any],
-        validator: Validator,
-    ) -> ValidatorResult:
-        """Run a single validation check."""
-        glyph = context.get("glyph")
-        mutation = context.get("mutation")
-        source = context.get("source", "unknown")
-        history = context.get("history", [])
+    ) -> List[ValidatorResult]:
+        """
+        Run all checks for a validator.
         
-        # Check implementations
-        if check.name == "no_identity_fixation":
-            # Glyphs cannot contain identity-like content
-            if glyph and "identity" in glyph.explanation.lower():
-                return ValidatorResult(
-                    passed=False,
-                    validator_id=validator.validator_id,
-                    check_name=check.name,
-                    message="Glyph explanation contains identity reference",
-                    action=validator.on_fail,
-                )
+        Returns the failures only; an empty list means every check passed.
         
-        elif check.name == "ttl_required":
-            if glyph and glyph.ttl_seconds <= 0:
-                return ValidatorResult(
-                    passed=False,
-                    validator_id=validator.validator_id,
-                    check_name=check.name,
-                    message="Glyph has no TTL",
-                    action=validator.on_fail,
-                )
+        Context should contain:
+        - glyph: The glyph being validated
+        - mutation: The mutation being applied
+        - source: The source of the mutation
+        - history: Recent mutation history for the glyph
+        - mutation_counts: Optional mutation type -> count over that
+          history; when given, history is not rescanned
+        """
+        validator, error = self._preflight(validator_id)
+        if validator is None:
+            return [error]
         
-        elif check.name == "no_recursive_amplification":
-            # Check if this glyph has been amplified recently
-            amplify_count = sum(1 for h in history if h.get("mutation") == "amplify")
-            if amplify_count >= 3:
-                return ValidatorResult(
-                    passed=False,
-                    validator_id=validator.validator_id,
-                    check_name=check.name,
-                    message="Recursive amplification detected",
-                    action=validator.on_fail,
-                )
+        inputs = _read_context(context)
+        failures = []
+        for check, impl, is_critical in validator.compiled():
+            result = impl(check, validator, *inputs)
+            if result is not None:
+                failures.append(result)
+                # Stop on critical failure
+                if is_critical:
+                    break
         
-        elif check.name == "authentication_required":
-            if source == "unknown" or not context.get("authenticated", False):
-                return ValidatorResult(
-                    passed=False,
-                    validator_id=validator.validator_id,
-                    check_name=check.name,
-                    message="Unauthenticated mutation attempt",
-                    action=validator.on_fail,
-                )
+        return failures
+    
+    def validate_transition_fast(
+        self,
+        validator_id: str,
+        context: Dict[str, Any],
+    ) -> Optional[ValidatorResult]:
+        """
+        Run a validator's checks, returning the first failure or None.
         
-        elif check.name == "max_intensity":
-            if glyph and glyph.intensity > 1.0:
-                return ValidatorResult(
-                    passed=False,
-                    validator_id=validator.validator_id,
-                    check_name=check.name,
-                    message="Intensity exceeds maximum",
-                    action=validator.on_fail,
-                )
+        For callers that only need a verdict: no result is built for
+        passing checks.
+        """
+        validator, error = self._preflight(validator_id)
+        if validator is None:
+            return error
         
-        # Default: pass
-        return ValidatorResult(
-            passed=True,
-            validator_id=validator.validator_id,
-            check_name=check.name,
-            message="Check passed",
-            action=ValidationAction.ALLOW,
-        )
+        inputs = _read_context(context)
+        for check, impl, _ in validator.compiled():
+            result = impl(check, validator, *inputs)
+            if result is not None:
+                return result
+        return None
+
+
+def _build_core_validators() -> Dict[str, Validator]:
+    """Build the built-in validators."""
+    validators: Dict[str, Validator] = {}
+    
+    # V-00: Genesis validator
+    validators["V-00"] = Validator(
+        validator_id="V-00",
+        name="Genesis Validator",
+        checks=[
+            ValidationCheck(
+                name="no_identity_fixation",
+                description="Glyphs cannot represent identity",
+                is_critical=True,
+            ),
+            ValidationCheck(
+                name="ttl_required",
+                description="All glyphs must have TTL",
+                is_critical=True,
+            ),
+        ],
+        on_fail=ValidationAction.HALT,
+    )
+    
+    # V-01: Standard session validator
+    # Cheapest checks (single attribute reads) first
+    validators["V-01"] = Validator(
+        validator_id="V-01",
+        name="Standard Session Validator",
+        checks=[
+            ValidationCheck(
+                name="max_intensity",
+                description="Intensity cannot exceed 1.0",
+                is_critical=False,
+            ),
+            ValidationCheck(
+                name="ttl_required",
+                description="All glyphs must have TTL",
+                is_critical=True,
+            ),
+            ValidationCheck(
+                name="no_recursive_amplification",
+                description="Cannot amplify same glyph repeatedly",
+                is_critical=True,
+            ),
+            ValidationCheck(
+                name="no_identity_fixation",
+                description="Glyphs cannot represent identity",
+                is_critical=True,
+            ),
+            ValidationCheck(
+                name="authentication_required",
+                description="Mutations require authenticated source",
+                is_critical=True,
+            ),
+        ],
+        on_fail=ValidationAction.HALT,
+    )
+    
+    # V-02: Multi-agent validator (Gap #4)
+    validators["V-02"] = Validator(
+        validator_id="V-02",
+        name="Multi-Agent Validator",
+        checks=[
+            ValidationCheck(
+                name="no_ownership_conflict",
+                description="Cannot mutate glyph owned by another agent without consent",
+                is_critical=True,
+            ),
+            ValidationCheck(
+                name="no_race_condition",
+                description="Check for concurrent modification attempts",
+                is_critical=True,
+            ),
+        ],
+        on_fail=ValidationAction.REQUEST_CONFIRMATION,
+    )
+    
+    # Seal with checksums and resolve check implementations
+    for vid, v in validators.items():
+        v = v.model_copy(update={"checksum": v.compute_checksum()})
+        v.compiled()
+        validators[vid] = v
+    
+    return validators
+
+
+# Static, so built (and checksummed) once at import
+_CORE_VALIDATORS: Mapping[str, Validator] = MappingProxyType(_build_core_validators())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+⟡ Bake Registry — Pre-convert BEACON_REGISTRY.yaml to JSON
+
+Usage:
+    python scripts/bake_registry.py [path/to/BEACON_REGISTRY.yaml]
+
+Writes BEACON_REGISTRY.json next to the YAML, stamped with the YAML's
+SHA-256. The loader in glyph_engine.registry reads the JSON only while
+that hash still matches the YAML, skipping the YAML parse at runtime,
+and falls back to the YAML otherwise. The loader never writes the
+sidecar; re-run this script after editing the registry. The YAML
+remains canonical.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from glyph_engine.registry import DEFAULT_REGISTRY_PATH, bake_sidecar
+
+
+def main():
+    yaml_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REGISTRY_PATH
+    if not yaml_path.exists():
+        print(f"❌ Registry not found: {yaml_path}", file=sys.stderr)
+        sys.exit(1)
+    
+    try:
+        json_path = bake_sidecar(yaml_path)
+    except (TypeError, ValueError) as e:
+        print(f"❌ Registry is not plain JSON data: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ Baked {yaml_path.name} → {json_path}")
+
+
+if __name__ == "__main__":
+    main()